@@ -1,24 +1,103 @@
 # app/auth.py
-from passlib.context import CryptContext
-from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from fastapi import HTTPException, status, Depends
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from datetime import timedelta
+from fastapi import HTTPException, Request, status, Depends
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer
 from typing import Optional
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import asyncio
+import bcrypt
+import hashlib
+import hmac
+import jwt
 import logging
+import orjson
+import re
+import threading
+import time
 
 from app.config import settings
+from app import cache
 from app.database import get_db
 from app import models
 
 logger = logging.getLogger(__name__)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: Argon2id for new hashes, bcrypt kept to verify (and upgrade) legacy hashes
+password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
+    parallelism=settings.argon2_parallelism,
+)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_MAX_BYTES = 72  # bcrypt only looks at the first 72 bytes
+
+# Verified against when the email is unknown, so that path costs the same as a wrong password
+_DUMMY_PASSWORD_HASH = password_hasher.hash("not-a-real-password-timing-equalizer")
+
+# Password hashing is CPU-bound; async routes hand it to this bounded pool to keep the event loop free
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+# Same scheme, but a missing Authorization header yields None instead of a 401
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
+
+
+# Auth failures are built fresh on every raise: a shared instance would carry
+# one request's traceback (and its frames) into the next, across threads
+def _credentials_exception() -> HTTPException:
+    """401 for a missing or invalid token, or a user it no longer matches"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _inactive_account_exception() -> HTTPException:
+    """401 for a deactivated account"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Account is deactivated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+# JWT settings don't change at runtime; read them once
+_JWT_SECRET = settings.secret_key
+_JWT_ALGORITHM = settings.algorithm
+_JWT_EXPIRE_SECONDS = settings.access_token_expire_minutes * 60
+
+# Verified token cache: raw token -> {"sub", "uid", "exp"}; entries are also checked against their own exp
+_token_cache = TTLCache(maxsize=settings.token_cache_size, ttl=_JWT_EXPIRE_SECONDS)
+_token_cache_lock = threading.Lock()
+
+# Recent successful logins: email -> (sha256 of credentials, user id, stored password hash);
+# plaintext is never stored. Entries are per process, so a hit is only trusted while
+# the user's stored hash (and email) still match what was verified
+_login_cache = TTLCache(maxsize=1024, ttl=settings.login_cache_ttl_seconds)
+_login_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CurrentIdentity:
+    """The caller's identity and role, for checks that don't need the full user row"""
+    id: int
+    email: str
+    is_admin: bool
+
+
+def identity_cache_key(user_id: int) -> str:
+    """Shared cache key for a user's identity/role entry"""
+    return f"user:{user_id}"
 
 
 class AuthService:
@@ -28,13 +107,128 @@ class AuthService:
     
     @staticmethod
     def hash_password(password: str) -> str:
-        """Hash a password using bcrypt"""
-        return pwd_context.hash(password)
+        """Hash a password using Argon2id"""
+        return password_hasher.hash(password)
     
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash"""
-        return pwd_context.verify(plain_password, hashed_password)
+        """Verify a password against its Argon2id or legacy bcrypt hash"""
+        try:
+            if hashed_password.startswith(_BCRYPT_PREFIXES):
+                return bcrypt.checkpw(
+                    plain_password.encode("utf-8")[:_BCRYPT_MAX_BYTES],
+                    hashed_password.encode("utf-8"),
+                )
+            return password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError, ValueError):
+            return False
+    
+    @staticmethod
+    async def verify_dummy_password_async(plain_password: str) -> None:
+        """Run one throwaway verification to hide whether an email is registered"""
+        await AuthService.verify_password_async(plain_password, _DUMMY_PASSWORD_HASH)
+    
+    @staticmethod
+    def password_needs_rehash(hashed_password: str) -> bool:
+        """Whether a hash is legacy bcrypt or uses outdated Argon2 parameters"""
+        if hashed_password.startswith(_BCRYPT_PREFIXES):
+            return True
+        try:
+            return password_hasher.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return True
+    
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash a password in the password hashing pool, off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, AuthService.hash_password, password)
+    
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the password hashing pool, off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _password_executor, AuthService.verify_password, plain_password, hashed_password
+        )
+    
+    @staticmethod
+    async def rehash_password_if_needed(user: models.User, plain_password: str, db: Session) -> None:
+        """
+        Upgrade a stale password hash after a successful login
+        
+        Hashes made with an older cost (or a deprecated scheme) are
+        re-hashed with the current settings, so cost changes roll out lazily.
+        
+        Args:
+            user: User whose password was just verified
+            plain_password: The verified plain text password
+            db: Database session
+        """
+        if AuthService.password_needs_rehash(user.password):
+            user.password = await AuthService.hash_password_async(plain_password)
+            db.commit()
+            logger.info("Password hash upgraded for user: %s", user.email)
+    
+    @staticmethod
+    def _login_digest(email: str, password: str) -> bytes:
+        """SHA-256 of the credentials, used as the login cache check value"""
+        return hashlib.sha256(email.encode("utf-8") + b":" + password.encode("utf-8")).digest()
+    
+    @staticmethod
+    def get_cached_login(email: str, password: str, db: Session) -> Optional[models.User]:
+        """
+        Return the user for credentials verified within the login cache window
+        
+        Args:
+            email: User's email
+            password: Plain text password
+            db: Database session
+            
+        Returns:
+            User object loaded by primary key on a cache hit, None otherwise
+        """
+        with _login_cache_lock:
+            entry = _login_cache.get(email)
+        if entry is None:
+            return None
+        
+        digest, user_id, password_hash = entry
+        if not hmac.compare_digest(digest, AuthService._login_digest(email, password)):
+            return None
+        
+        # invalidate_login_cache only reaches this worker; a password or email
+        # changed through another worker shows up in the row itself
+        user = db.get(models.User, user_id)
+        if user is None or user.email != email or not hmac.compare_digest(user.password, password_hash):
+            return None
+        return user
+    
+    @staticmethod
+    def cache_login(email: str, password: str, user: models.User) -> None:
+        """Remember a successful password check so a repeated login skips bcrypt"""
+        with _login_cache_lock:
+            _login_cache[email] = (AuthService._login_digest(email, password), user.id, user.password)
+    
+    @staticmethod
+    def invalidate_login_cache(email: str) -> None:
+        """Drop any cached login for the given email (e.g. after a password change)"""
+        with _login_cache_lock:
+            _login_cache.pop(email, None)
+    
+    @staticmethod
+    def cache_identity(user: models.User) -> None:
+        """Store the identity/role fields get_current_identity needs in the shared cache"""
+        cache.set_json(
+            identity_cache_key(user.id),
+            {"id": user.id, "email": user.email, "is_admin": user.is_admin, "is_active": user.is_active},
+            settings.identity_cache_ttl_seconds
+        )
+    
+    @staticmethod
+    def invalidate_identity(user_id: int) -> None:
+        """Drop a cached identity after the user's email, role or status changes"""
+        cache.delete(identity_cache_key(user_id))
     
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -42,7 +236,7 @@ class AuthService:
         Create JWT access token
         
         Args:
-            data: Data to encode in token (typically {"sub": user_email})
+            data: Data to encode in token (typically {"sub": user_email, "uid": user_id})
             expires_delta: Custom expiration time (optional)
             
         Returns:
@@ -50,14 +244,77 @@ class AuthService:
         """
         to_encode = data.copy()
         
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        # Integer epoch seconds, which is what the "exp" claim holds anyway
+        lifetime = int(expires_delta.total_seconds()) if expires_delta else _JWT_EXPIRE_SECONDS
+        to_encode["exp"] = int(time.time()) + lifetime
+        # Serialize claims with orjson and sign the bytes directly (same as
+        # jwt.encode, minus its stdlib json.dumps step)
+        return jwt.api_jws.encode(orjson.dumps(to_encode), _JWT_SECRET, algorithm=_JWT_ALGORITHM)
+    
+    @staticmethod
+    def try_decode_token(token: str) -> Optional[dict]:
+        """
+        Verify JWT token and return its identity claims, or None if it is invalid
+        
+        Args:
+            token: JWT token string
+            
+        Returns:
+            Dict with "sub" (user email), "uid" (user id, None for legacy tokens)
+            and "exp", or None if verification fails
+        """
+        with _token_cache_lock:
+            cached = _token_cache.get(token)
+        if cached is not None and cached["exp"] > time.time():
+            return cached
+        
+        # Shared across workers; keyed by digest so raw bearer tokens never leave the process
+        shared_key = f"jwt:{hashlib.sha256(token.encode()).hexdigest()}"
+        cached = cache.get_json(shared_key)
+        if cached is not None and cached["exp"] > time.time():
+            with _token_cache_lock:
+                _token_cache[token] = cached
+            return cached
         
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-        return encoded_jwt
+        try:
+            payload = jwt.decode(token, _JWT_SECRET, algorithms=[_JWT_ALGORITHM])
+        except jwt.InvalidTokenError as e:
+            logger.warning("Token verification failed: %s", e)
+            return None
+        
+        email: str = payload.get("sub")
+        if email is None:
+            return None
+        
+        claims = {"sub": email, "uid": payload.get("uid"), "exp": payload.get("exp")}
+        
+        # Only tokens that passed verification and carry an expiry are cached
+        if claims["exp"] is not None:
+            with _token_cache_lock:
+                _token_cache[token] = claims
+            cache.set_json(shared_key, claims, int(claims["exp"] - time.time()))
+        return claims
+    
+    @staticmethod
+    def decode_token(token: str, credentials_exception: Optional[HTTPException] = None) -> dict:
+        """
+        Verify JWT token and return its identity claims
+        
+        Args:
+            token: JWT token string
+            credentials_exception: Exception to raise if verification fails
+                (default: a new 401 "Could not validate credentials")
+            
+        Returns:
+            Dict with "sub" (user email), "uid" (user id, None for legacy tokens) and "exp"
+            
+        Raises:
+            HTTPException: If token is invalid
+        """
+        claims = AuthService.try_decode_token(token)
+        if claims is None:
+            raise credentials_exception or _credentials_exception()
+        return claims
     
     @staticmethod
     def verify_token(token: str, credentials_exception: HTTPException) -> str:
@@ -74,18 +331,38 @@ class AuthService:
         Raises:
             HTTPException: If token is invalid
         """
-        try:
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-            email: str = payload.get("sub")
-            if email is None:
-                raise credentials_exception
-            return email
-        except JWTError as e:
-            logger.warning(f"Token verification failed: {str(e)}")
-            raise credentials_exception
+        return AuthService.decode_token(token, credentials_exception)["sub"]
     
     @staticmethod
-    def authenticate_user(email: str, password: str, db: Session) -> Optional[models.User]:
+    def get_user_for_claims(claims: dict, db: Session) -> Optional[models.User]:
+        """
+        Load the user a verified token was issued to
+        
+        Tokens carrying a "uid" claim use a primary key lookup (served from the
+        session identity map when possible); legacy tokens fall back to email.
+        The password hash is deferred since auth checks only need the flags;
+        routes that do read it (change-password) load it on first access.
+        
+        Args:
+            claims: Claims returned by decode_token
+            db: Database session
+            
+        Returns:
+            User object, or None if the user no longer matches the token
+        """
+        if claims["uid"] is None:
+            return db.query(models.User).options(
+                defer(models.User.password)
+            ).filter(models.User.email == claims["sub"]).first()
+        
+        user = db.get(models.User, claims["uid"], options=[defer(models.User.password)])
+        # A token issued before an email change no longer identifies the user
+        if user is None or user.email != claims["sub"]:
+            return None
+        return user
+    
+    @staticmethod
+    async def authenticate_user(email: str, password: str, db: Session) -> Optional[models.User]:
         """
         Authenticate user with email and password
         
@@ -97,21 +374,34 @@ class AuthService:
         Returns:
             User object if authentication successful, None otherwise
         """
-        user = db.query(models.User).filter(models.User.email == email).first()
+        cached_user = AuthService.get_cached_login(email, password, db)
+        user = cached_user or db.query(models.User).filter(models.User.email == email).first()
         if not user:
+            await AuthService.verify_dummy_password_async(password)
             return None
-        if not AuthService.verify_password(password, user.password):
-            return None
+        if cached_user is None:
+            if not await AuthService.verify_password_async(password, user.password):
+                return None
+            await AuthService.rehash_password_if_needed(user, password, db)
+            AuthService.cache_login(email, password, user)
         if not user.is_active:
             return None
         return user
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
+def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> models.User:
     """
     Dependency to get current authenticated user from JWT token
     
+    The resolved user is memoized on request.state, so a second resolution
+    in the same request reuses it without another token decode or query.
+    
     Args:
+        request: Incoming request
         token: JWT token from Authorization header
         db: Database session
         
@@ -121,55 +411,119 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    user = getattr(request.state, "current_user", None)
+    if user is not None:
+        return user
     
     try:
-        email = AuthService.verify_token(token, credentials_exception)
-        user = db.query(models.User).filter(models.User.email == email).first()
+        claims = AuthService.decode_token(token)
+        user = AuthService.get_user_for_claims(claims, db)
         
         if user is None:
-            logger.warning(f"User not found for email: {email}")
-            raise credentials_exception
+            logger.warning("User not found for email: %s", claims['sub'])
+            raise _credentials_exception()
         
         if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Account is deactivated",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise _inactive_account_exception()
         
+        request.state.current_user = user
         return user
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in get_current_user: {str(e)}")
-        raise credentials_exception
+        logger.error("Error in get_current_user: %s", e)
+        raise _credentials_exception() from None
 
 
-def get_current_active_user(current_user: models.User = Depends(get_current_user)) -> models.User:
+def get_current_identity(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> CurrentIdentity:
     """
-    Dependency to get current active user (additional check for active status)
+    Lightweight dependency returning the caller's id, email and admin flag
+    
+    Served from the shared cache (filled at login and on first use, dropped
+    whenever the user's email, role or status changes); on a miss only those
+    columns are selected, so no User row is hydrated. Deactivated accounts
+    are rejected like in get_current_user.
     
     Args:
-        current_user: Current user from get_current_user dependency
+        token: JWT token from Authorization header
+        db: Database session (only used on a cache miss)
+        
+    Returns:
+        Current user's identity
+        
+    Raises:
+        HTTPException: If token is invalid, user not found or deactivated
+    """
+    claims = AuthService.decode_token(token)
+    
+    entry = cache.get_json(identity_cache_key(claims["uid"])) if claims["uid"] is not None else None
+    if entry is None:
+        lookup = (
+            models.User.id == claims["uid"] if claims["uid"] is not None
+            else models.User.email == claims["sub"]
+        )
+        row = db.query(
+            models.User.id, models.User.email, models.User.is_admin, models.User.is_active
+        ).filter(lookup).first()
+        if row is None:
+            raise _credentials_exception()
+        AuthService.cache_identity(row)
+        entry = row._asdict()
+    
+    # A token issued before an email change no longer identifies the user
+    if entry["email"] != claims["sub"]:
+        raise _credentials_exception()
+    if not entry["is_active"]:
+        raise _inactive_account_exception()
+    return CurrentIdentity(id=entry["id"], email=entry["email"], is_admin=entry["is_admin"])
+
+
+def require_admin(identity: CurrentIdentity = Depends(get_current_identity)) -> CurrentIdentity:
+    """
+    Dependency for admin-only endpoints that only need the caller's identity
+    
+    Args:
+        identity: Current identity from get_current_identity
         
     Returns:
-        Current active user
+        Current admin identity
         
     Raises:
-        HTTPException: If user is inactive
+        HTTPException: If user is not an admin
     """
-    if not current_user.is_active:
+    if not identity.is_admin:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
         )
-    return current_user
+    return identity
+
+
+def get_current_user_id(identity: CurrentIdentity = Depends(get_current_identity)) -> int:
+    """
+    Lightweight dependency returning only the authenticated user's ID
+    
+    For read endpoints that just need the ID (e.g. is_liked flags). Goes
+    through get_current_identity, so no user row is loaded (a shared cache
+    hit or a four-column select) and deactivated accounts are still
+    rejected with 401.
+    
+    Args:
+        identity: Current identity from get_current_identity
+        
+    Returns:
+        Current user's ID
+    """
+    return identity.id
+
+
+# get_current_user already rejects deactivated accounts (401); kept as an
+# alias so existing imports keep working without a second is_active check
+get_current_active_user = get_current_user
 
 
 def get_current_admin_user(current_user: models.User = Depends(get_current_user)) -> models.User:
@@ -194,13 +548,14 @@ def get_current_admin_user(current_user: models.User = Depends(get_current_user)
 
 
 def get_optional_current_user(
-    token: Optional[str] = Depends(oauth2_scheme), 
+    token: Optional[str] = Depends(optional_oauth2_scheme), 
     db: Session = Depends(get_db)
 ) -> Optional[models.User]:
     """
     Optional dependency to get current user (doesn't raise exception if no token)
     
-    Useful for endpoints that work differently for authenticated vs anonymous users
+    Useful for endpoints that work differently for authenticated vs anonymous users.
+    Every failure just returns None, so no exceptions are raised along the way.
     
     Args:
         token: JWT token from Authorization header (optional)
@@ -209,33 +564,30 @@ def get_optional_current_user(
     Returns:
         User object if authenticated, None if anonymous
     """
-    if token is None:
+    if not token:
         return None
     
-    try:
-        credentials_exception = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-        
-        email = AuthService.verify_token(token, credentials_exception)
-        user = db.query(models.User).filter(models.User.email == email).first()
-        
-        if user and user.is_active:
-            return user
-        return None
-        
-    except HTTPException:
-        return None
-    except Exception as e:
-        logger.error(f"Error in get_optional_current_user: {str(e)}")
+    claims = AuthService.try_decode_token(token)
+    if claims is None:
         return None
+    
+    user = AuthService.get_user_for_claims(claims, db)
+    if user and user.is_active:
+        return user
+    return None
 
 
 # Create auth service instance for easy access
 auth_service = AuthService()
 
+# One C-level pass that accepts any password satisfying every rule below;
+# the ASCII classes are subsets of the str methods, so a match is always valid
+_STRONG_PASSWORD_RE = re.compile(
+    r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]).{8,}",
+    re.DOTALL,
+)
+_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
 
 # Utility functions for password validation
 def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -248,6 +600,10 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if _STRONG_PASSWORD_RE.fullmatch(password):
+        return True, "Password is strong"
+    
+    # Slow path only to find which rule failed (or to accept non-ASCII letters)
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
@@ -260,7 +616,7 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if not any(c.isdigit() for c in password):
         return False, "Password must contain at least one digit"
     
-    if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+    if _SPECIAL_CHARACTERS.isdisjoint(password):
         return False, "Password must contain at least one special character"
     
     return True, "Password is strong"
@@ -288,19 +644,8 @@ def create_user_with_validation(user_data: dict, db: Session) -> models.User:
             detail=message
         )
     
-    # Check if user already exists
-    existing_user = db.query(models.User).filter(
-        models.User.email == user_data["email"]
-    ).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    
     try:
-        # Create user
+        # Create user; the unique index on email rejects duplicates
         hashed_password = auth_service.hash_password(user_data["password"])
         new_user = models.User(
             name=user_data["name"],
@@ -312,12 +657,18 @@ def create_user_with_validation(user_data: dict, db: Session) -> models.User:
         db.commit()
         db.refresh(new_user)
 
-        logger.info(f"New user created: {new_user.email}")
+        logger.info("New user created: %s", new_user.email)
         return new_user
 
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     except Exception as e:
         import traceback
-        logger.error(f"Error creating user: {e}")
+        logger.error("Error creating user: %s", e)
         logger.error(traceback.format_exc())
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,8 +1,11 @@
 # app/auth_routes.py
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import timedelta
+import hmac
 import logging
 
 from app.database import get_db
@@ -11,7 +14,9 @@ from app.schemas import (
     UserCreate, UserResponse, UserLogin, Token, 
     BaseResponse, ErrorResponse
 )
-from app.auth import AuthService, get_current_user
+from app import cache
+from app.auth import AuthService, CurrentIdentity, get_current_user, require_admin
+from app.user_routes import profile_cache_key
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -27,16 +32,8 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     - **password**: Strong password (min 6 chars, must contain uppercase, lowercase, digit)
     """
     try:
-        # Check if user already exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        # Create new user
-        hashed_password = AuthService.hash_password(user_data.password)
+        # Create new user; the unique index on email rejects duplicates
+        hashed_password = await AuthService.hash_password_async(user_data.password)
         new_user = User(
             name=user_data.name,
             email=user_data.email,
@@ -45,19 +42,24 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
         
         db.add(new_user)
         db.commit()
-        db.refresh(new_user)
         
-        logger.info(f"New user registered: {new_user.email}")
+        logger.info("New user registered: %s", user_data.email)
         
         return BaseResponse(
             success=True,
             message=f"User '{user_data.name}' registered successfully"
         )
         
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Registration error: {str(e)}")
+        logger.error("Registration error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -77,9 +79,11 @@ async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Sessi
     """
     try:
         # Find user by email (OAuth2 uses 'username' field for email)
-        user = db.query(User).filter(User.email == form_data.username).first()
+        cached_user = AuthService.get_cached_login(form_data.username, form_data.password, db)
+        user = cached_user or db.query(User).filter(User.email == form_data.username).first()
         
         if not user:
+            await AuthService.verify_dummy_password_async(form_data.password)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
@@ -94,30 +98,34 @@ async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Sessi
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Verify password
-        if not AuthService.verify_password(form_data.password, user.password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Verify password (skipped when these credentials were verified moments ago)
+        if cached_user is None:
+            if not await AuthService.verify_password_async(form_data.password, user.password):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid email or password",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            await AuthService.rehash_password_if_needed(user, form_data.password, db)
+            AuthService.cache_login(form_data.username, form_data.password, user)
+        AuthService.cache_identity(user)
         
         # Create access token
-        access_token = AuthService.create_access_token(data={"sub": user.email})
+        access_token = AuthService.create_access_token(data={"sub": user.email, "uid": user.id})
         
-        logger.info(f"User logged in: {user.email}")
+        logger.info("User logged in: %s", user.email)
         
         return Token(
             access_token=access_token,
             token_type="bearer",
             expires_in=30 * 60,  # 30 minutes in seconds
-            user=UserResponse.from_orm(user)
+            user=UserResponse.from_orm_trusted(user)
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Login error: {str(e)}")
+        logger.error("Login error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Login failed"
@@ -134,14 +142,20 @@ async def login_with_email(login_data: UserLogin, db: Session = Depends(get_db))
     """
     try:
         # Find user by email
-        user = db.query(User).filter(User.email == login_data.email).first()
-        
-        if not user or not AuthService.verify_password(login_data.password, user.password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        cached_user = AuthService.get_cached_login(login_data.email, login_data.password, db)
+        user = cached_user or db.query(User).filter(User.email == login_data.email).first()
+        
+        if cached_user is None:
+            if not user:
+                await AuthService.verify_dummy_password_async(login_data.password)
+            if not user or not await AuthService.verify_password_async(login_data.password, user.password):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid email or password",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            await AuthService.rehash_password_if_needed(user, login_data.password, db)
+            AuthService.cache_login(login_data.email, login_data.password, user)
         
         if not user.is_active:
             raise HTTPException(
@@ -149,23 +163,24 @@ async def login_with_email(login_data: UserLogin, db: Session = Depends(get_db))
                 detail="Account is deactivated",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        AuthService.cache_identity(user)
         
         # Create access token
-        access_token = AuthService.create_access_token(data={"sub": user.email})
+        access_token = AuthService.create_access_token(data={"sub": user.email, "uid": user.id})
         
-        logger.info(f"User logged in via email: {user.email}")
+        logger.info("User logged in via email: %s", user.email)
         
         return Token(
             access_token=access_token,
             token_type="bearer",
             expires_in=30 * 60,
-            user=UserResponse.from_orm(user)
+            user=UserResponse.from_orm_trusted(user)
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Email login error: {str(e)}")
+        logger.error("Email login error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Login failed"
@@ -179,7 +194,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
     
     Requires: Bearer token in Authorization header
     """
-    return UserResponse.from_orm(current_user)
+    return UserResponse.from_orm_trusted(current_user)
 
 
 @router.post("/logout", response_model=BaseResponse)
@@ -191,7 +206,7 @@ async def logout_user(current_user: User = Depends(get_current_user)):
     by removing the token. This endpoint is here for consistency and
     can be extended for token blacklisting if needed.
     """
-    logger.info(f"User logged out: {current_user.email}")
+    logger.info("User logged out: %s", current_user.email)
     
     return BaseResponse(
         success=True,
@@ -216,7 +231,7 @@ async def change_password(
     """
     try:
         # Verify old password
-        if not AuthService.verify_password(old_password, current_user.password):
+        if not await AuthService.verify_password_async(old_password, current_user.password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Current password is incorrect"
@@ -229,17 +244,18 @@ async def change_password(
                 detail="New password must be at least 6 characters long"
             )
         
-        if new_password == old_password:
+        if hmac.compare_digest(new_password.encode(), old_password.encode()):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="New password must be different from current password"
             )
         
         # Update password
-        current_user.password = AuthService.hash_password(new_password)
+        current_user.password = await AuthService.hash_password_async(new_password)
         db.commit()
+        AuthService.invalidate_login_cache(current_user.email)
         
-        logger.info(f"Password changed for user: {current_user.email}")
+        logger.info("Password changed for user: %s", current_user.email)
         
         return BaseResponse(
             success=True,
@@ -249,7 +265,7 @@ async def change_password(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Password change error: {str(e)}")
+        logger.error("Password change error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -268,19 +284,19 @@ async def refresh_access_token(current_user: User = Depends(get_current_user)):
     """
     try:
         # Create new access token
-        access_token = AuthService.create_access_token(data={"sub": current_user.email})
+        access_token = AuthService.create_access_token(data={"sub": current_user.email, "uid": current_user.id})
         
-        logger.info(f"Token refreshed for user: {current_user.email}")
+        logger.info("Token refreshed for user: %s", current_user.email)
         
         return Token(
             access_token=access_token,
             token_type="bearer",
             expires_in=30 * 60,
-            user=UserResponse.from_orm(current_user)
+            user=UserResponse.from_orm_trusted(current_user)
         )
         
     except Exception as e:
-        logger.error(f"Token refresh error: {str(e)}")
+        logger.error("Token refresh error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to refresh token"
@@ -289,8 +305,8 @@ async def refresh_access_token(current_user: User = Depends(get_current_user)):
 
 # Admin only endpoints
 @router.get("/users", response_model=list[UserResponse])
-async def get_all_users(
-    current_user: User = Depends(get_current_user),
+def get_all_users(
+    current_user: CurrentIdentity = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -298,20 +314,20 @@ async def get_all_users(
     
     Requires: Admin user with Bearer token
     """
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
+    # Only the response columns; skips the password hash and ORM instances
+    rows = db.execute(
+        select(
+            User.id, User.name, User.email, User.is_active,
+            User.is_admin, User.created_at, User.updated_at
         )
-    
-    users = db.query(User).all()
-    return [UserResponse.from_orm(user) for user in users]
+    ).all()
+    return [UserResponse.from_orm_trusted(row) for row in rows]
 
 
 @router.patch("/users/{user_id}/toggle-status", response_model=BaseResponse)
-async def toggle_user_status(
+def toggle_user_status(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentIdentity = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -321,12 +337,6 @@ async def toggle_user_status(
     
     Requires: Admin user with Bearer token
     """
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
     try:
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
@@ -344,9 +354,11 @@ async def toggle_user_status(
         
         user.is_active = not user.is_active
         db.commit()
+        AuthService.invalidate_identity(user.id)
+        cache.delete(profile_cache_key(user.id))
         
         action = "activated" if user.is_active else "deactivated"
-        logger.info(f"User {user.email} {action} by admin {current_user.email}")
+        logger.info("User %s %s by admin %s", user.email, action, current_user.email)
         
         return BaseResponse(
             success=True,
@@ -356,7 +368,7 @@ async def toggle_user_status(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"User status toggle error: {str(e)}")
+        logger.error("User status toggle error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
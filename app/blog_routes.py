@@ -1,29 +1,174 @@
 # app/blog_routes.py
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, asc, or_, func
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import desc, asc, or_, func, literal, select, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
 import logging
+import threading
+import orjson
+from cachetools import TTLCache
 from datetime import datetime
 
+from app import cache
+from app.config import settings
 from app.database import get_db
 from app.models import Blog, User, Category, Tag, Comment, Like, blog_tags
 from app.schemas import (
     BlogCreate, BlogUpdate, BlogResponse, BlogWithStats, BlogListResponse,
-    PaginationResponse, PaginationParams, BlogFilter, BaseResponse,
+    PaginationParams, BlogFilter, BaseResponse,
     CommentCreate, CommentResponse, CommentUpdate, TagCreate, TagResponse,
     CategoryCreate, CategoryResponse, CategoryWithStats
 )
-from app.auth import get_current_user
+from app.auth import get_current_user, get_current_user_id
+from app.http_cache import (
+    PRIVATE_CACHE_CONTROL, PUBLIC_CACHE_CONTROL, conditional_response, make_etag
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Active categories with published blog counts; one global entry, cleared on writes
+_category_cache = TTLCache(maxsize=1, ttl=settings.category_cache_ttl_seconds)
+_category_cache_lock = threading.Lock()
+
+
+def invalidate_category_cache() -> None:
+    """Drop the cached category list after categories or blog counts change"""
+    with _category_cache_lock:
+        _category_cache.clear()
+
+
+def stats_cache_key(user_id: int) -> str:
+    """Shared cache key for a user's /user/my/stats payload"""
+    return f"stats:{user_id}"
+
+
+def invalidate_user_stats(*user_ids: int) -> None:
+    """Drop cached stats for users whose blogs or comments changed"""
+    for user_id in set(user_ids):
+        cache.delete(stats_cache_key(user_id))
+
+# In debug, any relationship a query didn't eager-load raises instead of
+# silently issuing a lazy SELECT (N+1 guard); production keeps lazy loading
+LAZY_LOAD_GUARD = (raiseload("*"),) if settings.debug else ()
+
+
+def make_excerpt(body: str) -> str:
+    """Derive a blog excerpt from its body (same rule as the SQL backfill in init_db)"""
+    return body[:297] + "..." if len(body) > 300 else body
+
+
+def resolve_tags(tag_names: List[str], db: Session) -> List[Tag]:
+    """
+    Get or create tags by name in a constant number of queries
+    
+    Args:
+        tag_names: Raw tag names; normalized to stripped lowercase and de-duplicated
+        db: Database session
+        
+    Returns:
+        Tag objects in the order the names were first given
+    """
+    names = list(dict.fromkeys(
+        name.strip().lower() for name in tag_names if name and name.strip()
+    ))
+    if not names:
+        return []
+    
+    tags_by_name = {tag.name: tag for tag in db.query(Tag).filter(Tag.name.in_(names)).all()}
+    missing = [name for name in names if name not in tags_by_name]
+    if missing:
+        # ON CONFLICT covers a concurrent request creating the same tag
+        db.execute(
+            pg_insert(Tag).values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        for tag in db.query(Tag).filter(Tag.name.in_(missing)).all():
+            tags_by_name[tag.name] = tag
+    
+    return [tags_by_name[name] for name in names]
+
+
+def apply_blog_filters(stmt, filters: BlogFilter):
+    """
+    Apply blog list filters to a query or select statement
+    
+    Args:
+        stmt: ORM Query or Core Select over Blog
+        filters: Blog filtering parameters
+        
+    Returns:
+        The statement with the filter predicates added
+    """
+    if filters.category_id:
+        stmt = stmt.where(Blog.category_id == filters.category_id)
+    
+    if filters.is_published is not None:
+        stmt = stmt.where(Blog.is_published == filters.is_published)
+    
+    if filters.is_featured is not None:
+        stmt = stmt.where(Blog.is_featured == filters.is_featured)
+    
+    if filters.author_id:
+        stmt = stmt.where(Blog.user_id == filters.author_id)
+    
+    if filters.search:
+        # Full-text match on title + body (GIN on search_vector); the title
+        # substring match keeps partial-word hits and uses the trigram index
+        search_query = func.plainto_tsquery("english", filters.search)
+        stmt = stmt.where(
+            or_(
+                Blog.search_vector.op("@@")(search_query),
+                Blog.title.ilike(f"%{filters.search}%")
+            )
+        )
+    
+    if filters.tag_names:
+        # Semi-join keeps one row per blog, so counts need no DISTINCT
+        tagged_blog_ids = select(blog_tags.c.blog_id).join(
+            Tag, Tag.id == blog_tags.c.tag_id
+        ).where(Tag.name.in_(filters.tag_names))
+        stmt = stmt.where(Blog.id.in_(tagged_blog_ids))
+    
+    return stmt
+
+
+def blog_stat_columns(user_id: Optional[int] = None) -> tuple:
+    """
+    Per-blog stats to select alongside Blog
+    
+    The counts are the trigger-maintained columns on blogs; is_liked is a
+    correlated EXISTS that Postgres evaluates only for the rows the outer
+    query returns (after LIMIT). A page and its stats come back in one
+    round trip.
+    
+    Args:
+        user_id: Viewer's user ID (optional)
+        
+    Returns:
+        Tuple of (comment_count, like_count, is_liked) column expressions
+    """
+    comment_count = Blog.comment_count.label("comment_count")
+    like_count = Blog.like_count.label("like_count")
+    
+    if user_id is None:
+        is_liked = literal(False).label("is_liked")
+    else:
+        is_liked = select(Like.id).where(
+            Like.blog_id == Blog.id,
+            Like.user_id == user_id
+        ).correlate(Blog).exists().label("is_liked")
+    
+    return comment_count, like_count, is_liked
+
 
 # BLOG CRUD OPERATIONS
 
 @router.post("/", response_model=BlogResponse, status_code=status.HTTP_201_CREATED)
-async def create_blog(
+def create_blog(
     blog_data: BlogCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -50,9 +195,7 @@ async def create_blog(
                 )
         
         # Create excerpt from body if not provided
-        excerpt = blog_data.excerpt
-        if not excerpt:
-            excerpt = blog_data.body[:297] + "..." if len(blog_data.body) > 300 else blog_data.body
+        excerpt = blog_data.excerpt or make_excerpt(blog_data.body)
         
         # Create new blog
         new_blog = Blog(
@@ -71,39 +214,29 @@ async def create_blog(
         
         # Handle tags
         if blog_data.tag_names:
-            for tag_name in blog_data.tag_names:
-                tag_name = tag_name.strip().lower()
-                if not tag_name:
-                    continue
-                    
-                # Get or create tag
-                tag = db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    db.add(tag)
-                    db.flush()
-                
-                # Associate tag with blog
-                new_blog.tags.append(tag)
+            new_blog.tags = resolve_tags(blog_data.tag_names, db)
         
         db.commit()
         db.refresh(new_blog)
         
-        logger.info(f"Blog created: {new_blog.title} by {current_user.email}")
+        invalidate_category_cache()
+        invalidate_user_stats(current_user.id)
+        logger.info("Blog created: %s by %s", new_blog.title, current_user.email)
         
         # Return with relationships loaded
         blog_with_relations = db.query(Blog).options(
             joinedload(Blog.creator),
             joinedload(Blog.category),
-            joinedload(Blog.tags)
+            selectinload(Blog.tags),
+            *LAZY_LOAD_GUARD
         ).filter(Blog.id == new_blog.id).first()
         
-        return BlogResponse.from_orm(blog_with_relations)
+        return BlogResponse.model_validate(blog_with_relations)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Blog creation error: {str(e)}")
+        logger.error("Blog creation error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -111,14 +244,193 @@ async def create_blog(
         )
 
 
+def _user_payload(user: User) -> dict:
+    """UserResponse fields of a trusted ORM row as a plain dict"""
+    return {
+        "name": user.name,
+        "email": user.email,
+        "id": user.id,
+        "is_active": user.is_active,
+        "is_admin": user.is_admin,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
+
+
+def _category_payload(category: Optional[Category]) -> Optional[dict]:
+    """CategoryResponse fields of a trusted ORM row as a plain dict"""
+    if category is None:
+        return None
+    return {
+        "name": category.name,
+        "description": category.description,
+        "id": category.id,
+        "is_active": category.is_active,
+        "created_at": category.created_at,
+        "updated_at": category.updated_at,
+    }
+
+
+def _tags_payload(tags: List[Tag]) -> List[dict]:
+    """TagResponse fields of trusted ORM rows as plain dicts"""
+    return [
+        {"name": tag.name, "color": tag.color, "id": tag.id, "created_at": tag.created_at}
+        for tag in tags
+    ]
+
+
+def blog_payload(blog: Blog) -> dict:
+    """
+    Build a BlogResponse-shaped dict straight from a loaded blog row
+    
+    Args:
+        blog: Blog with creator, category and tags loaded
+        
+    Returns:
+        JSON-ready dict with the same fields as BlogResponse
+    """
+    return {
+        "title": blog.title,
+        "body": blog.body,
+        "excerpt": blog.excerpt,
+        "category_id": blog.category_id,
+        "is_published": blog.is_published,
+        "is_featured": blog.is_featured,
+        "id": blog.id,
+        "view_count": blog.view_count,
+        "created_at": blog.created_at,
+        "updated_at": blog.updated_at,
+        "published_at": blog.published_at,
+        "creator": _user_payload(blog.creator),
+        "category": _category_payload(blog.category),
+        "tags": _tags_payload(blog.tags),
+    }
+
+
+def blog_summary_payload(blog: Blog, comment_count: int, like_count: int, is_liked: bool) -> dict:
+    """
+    Build a BlogSummaryWithStats-shaped dict straight from a loaded blog row
+    
+    The rows come from our own database, so list responses skip a second
+    Pydantic validation pass and are encoded directly with orjson.
+    
+    Args:
+        blog: Blog with creator, category and tags loaded
+        comment_count: Approved comments on the blog
+        like_count: Likes on the blog
+        is_liked: Whether the current user liked the blog
+        
+    Returns:
+        JSON-ready dict with the same fields as BlogSummaryWithStats
+    """
+    return {
+        "id": blog.id,
+        "title": blog.title,
+        "excerpt": blog.excerpt,
+        "category_id": blog.category_id,
+        "is_published": blog.is_published,
+        "is_featured": blog.is_featured,
+        "view_count": blog.view_count,
+        "created_at": blog.created_at,
+        "updated_at": blog.updated_at,
+        "published_at": blog.published_at,
+        "creator": _user_payload(blog.creator),
+        "category": _category_payload(blog.category),
+        "tags": _tags_payload(blog.tags),
+        "comment_count": comment_count,
+        "like_count": like_count,
+        "is_liked": is_liked,
+    }
+
+
+def blog_etag_parts(blog: Blog) -> tuple:
+    """
+    Values that change whenever a blog's rendered payload does (views aside)
+    
+    Tag links and author/category renames don't bump blogs.updated_at, so
+    the related rows are part of the ETag too.
+    
+    Args:
+        blog: Blog with creator, category and tags loaded
+        
+    Returns:
+        Tuple to feed to make_etag
+    """
+    category = blog.category
+    return (
+        blog.id,
+        blog.updated_at,
+        (blog.creator.id, blog.creator.name, blog.creator.updated_at),
+        (category.id, category.name, category.updated_at) if category else None,
+        [(tag.id, tag.name, tag.color) for tag in blog.tags],
+    )
+
+
+def build_thread(comments: List[Comment], replies: List[Comment]) -> List[dict]:
+    """
+    Nest replies under their parents without recursion
+    
+    Every comment becomes a CommentResponse-shaped dict indexed by id; one
+    pass over the replies then appends each to its parent's list, so the
+    thread depth never reaches the Python stack.
+    
+    Args:
+        comments: Top-level comments in display order (authors loaded)
+        replies: All replies in display order (authors loaded)
+        
+    Returns:
+        Top-level comment dicts with nested "replies"
+    """
+    by_id = {}
+    for comment in (*comments, *replies):
+        by_id[comment.id] = {
+            "content": comment.content,
+            "id": comment.id,
+            "blog_id": comment.blog_id,
+            "parent_id": comment.parent_id,
+            "is_approved": comment.is_approved,
+            "created_at": comment.created_at,
+            "updated_at": comment.updated_at,
+            "author": _user_payload(comment.author),
+            "replies": [],
+        }
+    
+    for reply in replies:
+        parent = by_id.get(reply.parent_id)
+        if parent is not None:  # Replies to unapproved comments stay hidden
+            parent["replies"].append(by_id[reply.id])
+    
+    return [by_id[comment.id] for comment in comments]
+
+
+def trusted_json_response(content, response: Response) -> Response:
+    """
+    Encode already-trusted data with orjson, bypassing response_model
+    
+    Args:
+        content: Dicts/lists of plain values built from our own rows
+        response: The endpoint's injected response, whose headers are kept
+        
+    Returns:
+        JSON response (datetimes in the same "Z" form Pydantic emits)
+    """
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_UTC_Z),
+        media_type="application/json",
+        headers=dict(response.headers)
+    )
+
+
 @router.get("/", response_model=BlogListResponse)
-async def get_blogs(
+def get_blogs(
+    request: Request,
+    response: Response,
     pagination: PaginationParams = Depends(),
     filters: BlogFilter = Depends(),
     sort_by: str = Query("created_at", description="Sort field: created_at, title, view_count"),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user)
+    current_user_id: int = Depends(get_current_user_id)
 ):
     """
     Get blogs with pagination, filtering, and sorting
@@ -140,37 +452,21 @@ async def get_blogs(
     - **sort_order**: asc, desc
     """
     try:
-        # Base query with relationships
-        query = db.query(Blog).options(
-            joinedload(Blog.creator),
+        # Base query with relationships and per-row stats; list items never
+        # need body or the author's password hash, so neither leaves the database
+        query = db.query(Blog, *blog_stat_columns(current_user_id)).options(
+            load_only(
+                Blog.id, Blog.title, Blog.excerpt, Blog.category_id, Blog.user_id,
+                Blog.is_published, Blog.is_featured, Blog.view_count,
+                Blog.created_at, Blog.updated_at, Blog.published_at
+            ),
+            joinedload(Blog.creator).defer(User.password),
             joinedload(Blog.category),
-            joinedload(Blog.tags)
+            selectinload(Blog.tags),
+            *LAZY_LOAD_GUARD
         )
         
-        # Apply filters
-        if filters.category_id:
-            query = query.filter(Blog.category_id == filters.category_id)
-        
-        if filters.is_published is not None:
-            query = query.filter(Blog.is_published == filters.is_published)
-        
-        if filters.is_featured is not None:
-            query = query.filter(Blog.is_featured == filters.is_featured)
-        
-        if filters.author_id:
-            query = query.filter(Blog.user_id == filters.author_id)
-        
-        if filters.search:
-            search_term = f"%{filters.search}%"
-            query = query.filter(
-                or_(
-                    Blog.title.ilike(search_term),
-                    Blog.body.ilike(search_term)
-                )
-            )
-        
-        if filters.tag_names:
-            query = query.join(Blog.tags).filter(Tag.name.in_(filters.tag_names))
+        query = apply_blog_filters(query, filters)
         
         # Apply sorting
         sort_column = getattr(Blog, sort_by, Blog.created_at)
@@ -179,64 +475,52 @@ async def get_blogs(
         else:
             query = query.order_by(desc(sort_column))
         
-        # Get total count
-        total = query.count()
+        # Get total count from the filter predicates alone (no eager loads or ORDER BY)
+        count_stmt = apply_blog_filters(select(func.count(Blog.id)).select_from(Blog), filters)
+        total = db.execute(count_stmt).scalar_one()
         
         # Apply pagination
         offset = (pagination.page - 1) * pagination.per_page
-        blogs = query.offset(offset).limit(pagination.per_page).all()
+        rows = query.offset(offset).limit(pagination.per_page).all()
         
         # Calculate pagination metadata
         pages = (total + pagination.per_page - 1) // pagination.per_page
         has_next = pagination.page < pages
         has_prev = pagination.page > 1
         
-        # Get additional stats for each blog
-        blog_stats = []
-        for blog in blogs:
-            # Get comment count
-            comment_count = db.query(Comment).filter(
-                Comment.blog_id == blog.id,
-                Comment.is_approved == True
-            ).count()
-            
-            # Get like count
-            like_count = db.query(Like).filter(Like.blog_id == blog.id).count()
-            
-            # Check if current user liked this blog
-            is_liked = False
-            if current_user:
-                like = db.query(Like).filter(
-                    Like.blog_id == blog.id,
-                    Like.user_id == current_user.id
-                ).first()
-                is_liked = like is not None
-            
-            blog_data = BlogResponse.from_orm(blog)
-            blog_with_stats = BlogWithStats(
-                **blog_data.dict(),
-                comment_count=comment_count,
-                like_count=like_count,
-                is_liked=is_liked
-            )
-            blog_stats.append(blog_with_stats)
-        
-        pagination_info = PaginationResponse(
-            total=total,
-            page=pagination.page,
-            per_page=pagination.per_page,
-            pages=pages,
-            has_next=has_next,
-            has_prev=has_prev
+        blog_stats = [
+            blog_summary_payload(blog, comment_count, like_count, is_liked)
+            for blog, comment_count, like_count, is_liked in rows
+        ]
+        
+        # is_liked makes the page per-user, so it is private and revalidated
+        # every time; a match still skips serializing and sending the page
+        etag = make_etag(
+            current_user_id, total,
+            [(blog_etag_parts(blog), blog.view_count, comment_count, like_count, is_liked)
+             for blog, comment_count, like_count, is_liked in rows]
         )
-        
-        return BlogListResponse(
-            blogs=blog_stats,
-            pagination=pagination_info
+        not_modified = conditional_response(request, response, etag, PRIVATE_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
+        
+        pagination_info = {
+            "total": total,
+            "page": pagination.page,
+            "per_page": pagination.per_page,
+            "pages": pages,
+            "has_next": has_next,
+            "has_prev": has_prev,
+        }
+        
+        # Returning a Response skips response_model validation; the schema
+        # still documents the shape in OpenAPI
+        return trusted_json_response(
+            {"blogs": blog_stats, "pagination": pagination_info}, response
         )
         
     except Exception as e:
-        logger.error(f"Blog retrieval error: {str(e)}")
+        logger.error("Blog retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve blogs"
@@ -244,10 +528,12 @@ async def get_blogs(
 
 
 @router.get("/{blog_id}", response_model=BlogWithStats)
-async def get_blog(
+def get_blog(
+    request: Request,
+    response: Response,
     blog_id: int,
     db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user)
+    current_user_id: int = Depends(get_current_user_id)
 ):
     """
     Get a specific blog by ID
@@ -257,50 +543,46 @@ async def get_blog(
     Automatically increments view count
     """
     try:
-        blog = db.query(Blog).options(
-            joinedload(Blog.creator),
-            joinedload(Blog.category),
-            joinedload(Blog.tags)
-        ).filter(Blog.id == blog_id).first()
-        
-        if not blog:
+        # Increment view count atomically in the database; keeping updated_at
+        # as-is so a view doesn't look like an edit
+        result = db.execute(
+            update(Blog).where(Blog.id == blog_id).values(
+                view_count=Blog.view_count + 1,
+                updated_at=Blog.updated_at
+            )
+        )
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
             )
-        
-        # Increment view count
-        blog.view_count += 1
         db.commit()
         
-        # Get additional stats
-        comment_count = db.query(Comment).filter(
-            Comment.blog_id == blog.id,
-            Comment.is_approved == True
-        ).count()
+        # The blog and its stats in one query
+        blog, comment_count, like_count, is_liked = db.query(
+            Blog, *blog_stat_columns(current_user_id)
+        ).options(
+            joinedload(Blog.creator),
+            joinedload(Blog.category),
+            selectinload(Blog.tags),
+            *LAZY_LOAD_GUARD
+        ).filter(Blog.id == blog_id).one()
         
-        like_count = db.query(Like).filter(Like.blog_id == blog.id).count()
+        # Weak ETag: edits (including tags, author and category) and engagement
+        # change it, views don't
+        etag = make_etag(current_user_id, blog_etag_parts(blog), comment_count, like_count, is_liked)
+        not_modified = conditional_response(request, response, etag, PRIVATE_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
         
-        is_liked = False
-        if current_user:
-            like = db.query(Like).filter(
-                Like.blog_id == blog.id,
-                Like.user_id == current_user.id
-            ).first()
-            is_liked = like is not None
-        
-        blog_data = BlogResponse.from_orm(blog)
-        return BlogWithStats(
-            **blog_data.dict(),
-            comment_count=comment_count,
-            like_count=like_count,
-            is_liked=is_liked
-        )
+        payload = blog_summary_payload(blog, comment_count, like_count, is_liked)
+        payload["body"] = blog.body
+        return trusted_json_response(payload, response)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Blog retrieval error: {str(e)}")
+        logger.error("Blog retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve blog"
@@ -308,7 +590,7 @@ async def get_blog(
 
 
 @router.put("/{blog_id}", response_model=BlogResponse)
-async def update_blog(
+def update_blog(
     blog_id: int,
     blog_data: BlogUpdate,
     current_user: User = Depends(get_current_user),
@@ -336,7 +618,7 @@ async def update_blog(
             )
         
         # Update fields
-        update_data = blog_data.dict(exclude_unset=True)
+        update_data = blog_data.model_dump(exclude_unset=True)
         
         # Handle category validation
         if "category_id" in update_data and update_data["category_id"]:
@@ -354,6 +636,10 @@ async def update_blog(
             elif not update_data["is_published"]:
                 blog.published_at = None
         
+        # Keep excerpt populated if it is cleared
+        if "excerpt" in update_data and not update_data["excerpt"]:
+            update_data["excerpt"] = make_excerpt(update_data.get("body") or blog.body)
+        
         # Update blog fields
         for field, value in update_data.items():
             if field != "tag_names":  # Handle tags separately
@@ -361,41 +647,29 @@ async def update_blog(
         
         # Handle tags if provided
         if "tag_names" in update_data:
-            # Clear existing tags
-            blog.tags.clear()
-            
-            # Add new tags
-            for tag_name in update_data["tag_names"]:
-                tag_name = tag_name.strip().lower()
-                if not tag_name:
-                    continue
-                    
-                tag = db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    db.add(tag)
-                    db.flush()
-                
-                blog.tags.append(tag)
+            blog.tags = resolve_tags(update_data["tag_names"] or [], db)
         
         db.commit()
         db.refresh(blog)
         
-        logger.info(f"Blog updated: {blog.title} by {current_user.email}")
+        invalidate_category_cache()
+        invalidate_user_stats(blog.user_id)
+        logger.info("Blog updated: %s by %s", blog.title, current_user.email)
         
         # Return with relationships loaded
         updated_blog = db.query(Blog).options(
             joinedload(Blog.creator),
             joinedload(Blog.category),
-            joinedload(Blog.tags)
+            selectinload(Blog.tags),
+            *LAZY_LOAD_GUARD
         ).filter(Blog.id == blog.id).first()
         
-        return BlogResponse.from_orm(updated_blog)
+        return BlogResponse.model_validate(updated_blog)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Blog update error: {str(e)}")
+        logger.error("Blog update error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -404,7 +678,7 @@ async def update_blog(
 
 
 @router.delete("/{blog_id}", response_model=BaseResponse)
-async def delete_blog(
+def delete_blog(
     blog_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -415,26 +689,35 @@ async def delete_blog(
     Only the blog author or admin can delete a blog
     """
     try:
-        blog = db.query(Blog).filter(Blog.id == blog_id).first()
-        
-        if not blog:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Blog not found"
-            )
+        # Permission check and delete in one statement; comments, likes and
+        # tag links go with it via ON DELETE CASCADE
+        conditions = [Blog.id == blog_id]
+        if not current_user.is_admin:
+            conditions.append(Blog.user_id == current_user.id)
+        deleted = db.execute(
+            delete(Blog).where(*conditions).returning(Blog.title, Blog.user_id),
+            execution_options={"synchronize_session": False}
+        ).first()
         
-        # Check permissions
-        if blog.user_id != current_user.id and not current_user.is_admin:
+        if not deleted:
+            # Only on failure: tell a missing blog from someone else's
+            blog_exists = db.query(select(Blog.id).where(Blog.id == blog_id).exists()).scalar()
+            if not blog_exists:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Blog not found"
+                )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to delete this blog"
             )
         
-        blog_title = blog.title
-        db.delete(blog)
+        blog_title, blog_owner_id = deleted
         db.commit()
         
-        logger.info(f"Blog deleted: {blog_title} by {current_user.email}")
+        invalidate_category_cache()
+        invalidate_user_stats(blog_owner_id)
+        logger.info("Blog deleted: %s by %s", blog_title, current_user.email)
         
         return BaseResponse(
             success=True,
@@ -444,7 +727,7 @@ async def delete_blog(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Blog deletion error: {str(e)}")
+        logger.error("Blog deletion error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -457,7 +740,7 @@ async def delete_blog(
 
 
 @router.post("/{blog_id}/like", response_model=BaseResponse)
-async def toggle_blog_like(
+def toggle_blog_like(
     blog_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -468,44 +751,53 @@ async def toggle_blog_like(
     If already liked, removes the like. If not liked, adds a like.
     """
     try:
-        blog = db.query(Blog).filter(Blog.id == blog_id).first()
-        if not blog:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Blog not found"
-            )
-        
-        # Check if user already liked this blog
-        existing_like = db.query(Like).filter(
-            Like.blog_id == blog_id,
-            Like.user_id == current_user.id
+        # The blog owner's like total changes, so their cached stats go stale;
+        # RETURNING reads the owner in the same round trip as the write
+        blog_owner_id = select(Blog.user_id).where(Blog.id == blog_id).scalar_subquery()
+        
+        # Try to like; the unique (blog_id, user_id) index makes this a no-op
+        # if the like already exists, in which case the toggle means unlike
+        changed = db.execute(
+            pg_insert(Like).values(blog_id=blog_id, user_id=current_user.id)
+            .on_conflict_do_nothing(index_elements=["blog_id", "user_id"])
+            .returning(Like.id, blog_owner_id)
         ).first()
         
-        if existing_like:
-            # Remove like
-            db.delete(existing_like)
+        if changed is None:
+            changed = db.execute(
+                delete(Like).where(
+                    Like.blog_id == blog_id,
+                    Like.user_id == current_user.id
+                ).returning(Like.id, blog_owner_id)
+            ).first()
             message = "Like removed"
             action = "unliked"
         else:
-            # Add like
-            new_like = Like(blog_id=blog_id, user_id=current_user.id)
-            db.add(new_like)
             message = "Blog liked"
             action = "liked"
         
         db.commit()
+        if changed is not None:
+            invalidate_user_stats(changed[1])
         
-        logger.info(f"Blog {action}: {blog.title} by {current_user.email}")
+        logger.info("Blog %s: %s by %s", action, blog_id, current_user.email)
         
         return BaseResponse(
             success=True,
             message=message
         )
         
+    except IntegrityError:
+        # Foreign key violation: the blog doesn't exist
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blog not found"
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Blog like toggle error: {str(e)}")
+        logger.error("Blog like toggle error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -518,7 +810,8 @@ async def toggle_blog_like(
 
 
 @router.get("/{blog_id}/comments", response_model=List[CommentResponse])
-async def get_blog_comments(
+def get_blog_comments(
+    response: Response,
     blog_id: int,
     db: Session = Depends(get_db)
 ):
@@ -534,33 +827,30 @@ async def get_blog_comments(
             )
         
         comments = db.query(Comment).options(
-            joinedload(Comment.author)
+            joinedload(Comment.author),
+            *LAZY_LOAD_GUARD
         ).filter(
             Comment.blog_id == blog_id,
             Comment.is_approved == True,
             Comment.parent_id == None  # Only top-level comments
         ).order_by(desc(Comment.created_at)).all()
         
-        # Get replies for each comment
-        comment_responses = []
-        for comment in comments:
-            replies = db.query(Comment).options(
-                joinedload(Comment.author)
-            ).filter(
-                Comment.parent_id == comment.id,
-                Comment.is_approved == True
-            ).order_by(asc(Comment.created_at)).all()
-            
-            comment_data = CommentResponse.from_orm(comment)
-            comment_data.replies = [CommentResponse.from_orm(reply) for reply in replies]
-            comment_responses.append(comment_data)
+        # Get every approved reply in the thread with one query
+        replies = db.query(Comment).options(
+            joinedload(Comment.author),
+            *LAZY_LOAD_GUARD
+        ).filter(
+            Comment.blog_id == blog_id,
+            Comment.is_approved == True,
+            Comment.parent_id != None
+        ).order_by(asc(Comment.created_at)).all()
         
-        return comment_responses
+        return trusted_json_response(build_thread(comments, replies), response)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Comment retrieval error: {str(e)}")
+        logger.error("Comment retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve comments"
@@ -568,7 +858,7 @@ async def get_blog_comments(
 
 
 @router.post("/{blog_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
-async def create_comment(
+def create_comment(
     blog_id: int,
     comment_data: CommentCreate,
     current_user: User = Depends(get_current_user),
@@ -611,19 +901,22 @@ async def create_comment(
         db.commit()
         db.refresh(new_comment)
         
-        logger.info(f"Comment created on blog {blog.title} by {current_user.email}")
+        invalidate_user_stats(current_user.id, blog.user_id)
+        logger.info("Comment created on blog %s by %s", blog.title, current_user.email)
         
         # Return with author loaded
         comment_with_author = db.query(Comment).options(
-            joinedload(Comment.author)
+            joinedload(Comment.author),
+            *LAZY_LOAD_GUARD
         ).filter(Comment.id == new_comment.id).first()
+        set_committed_value(comment_with_author, "replies", [])  # Brand new, no replies yet
         
-        return CommentResponse.from_orm(comment_with_author)
+        return CommentResponse.model_validate(comment_with_author)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Comment creation error: {str(e)}")
+        logger.error("Comment creation error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -636,31 +929,61 @@ async def create_comment(
 
 
 @router.get("/categories/", response_model=List[CategoryWithStats])
-async def get_categories(db: Session = Depends(get_db)):
+def get_categories(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
     """
     Get all active categories with blog counts
     """
+    with _category_cache_lock:
+        category_stats = _category_cache.get("categories")
+    if category_stats is None:
+        category_stats = load_category_stats(db)
+        with _category_cache_lock:
+            _category_cache["categories"] = category_stats
+    
+    etag = make_etag([(c.id, c.updated_at, c.blog_count) for c in category_stats])
+    not_modified = conditional_response(request, response, etag, PUBLIC_CACHE_CONTROL)
+    if not_modified is not None:
+        return not_modified
+    return category_stats
+
+
+def load_category_stats(db: Session) -> List[CategoryWithStats]:
+    """
+    Load active categories with their published blog counts
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Categories with blog_count set
+    """
     try:
         categories = db.query(Category).filter(Category.is_active == True).all()
         
+        # Published blog counts for every category in one grouped query
+        blog_counts = dict(
+            db.query(Blog.category_id, func.count(Blog.id)).filter(
+                Blog.is_published == True,
+                Blog.category_id.isnot(None)
+            ).group_by(Blog.category_id).all()
+        )
+        
         category_stats = []
         for category in categories:
-            blog_count = db.query(Blog).filter(
-                Blog.category_id == category.id,
-                Blog.is_published == True
-            ).count()
+            blog_count = blog_counts.get(category.id, 0)
             
-            category_data = CategoryResponse.from_orm(category)
-            category_with_stats = CategoryWithStats(
-                **category_data.dict(),
-                blog_count=blog_count
-            )
+            category_with_stats = CategoryWithStats.model_validate(category)
+            category_with_stats.blog_count = blog_count
             category_stats.append(category_with_stats)
         
         return category_stats
         
     except Exception as e:
-        logger.error(f"Category retrieval error: {str(e)}")
+        logger.error("Category retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve categories"
@@ -672,7 +995,7 @@ async def get_categories(db: Session = Depends(get_db)):
 
 
 @router.post("/categories/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
-async def create_category(
+def create_category(
     category_data: CategoryCreate,
     db: Session = Depends(get_db)
 ):
@@ -689,6 +1012,7 @@ async def create_category(
     db.add(new_category)
     db.commit()
     db.refresh(new_category)
+    invalidate_category_cache()
     return new_category
 
 
@@ -698,7 +1022,9 @@ async def create_category(
 
 
 @router.get("/tags/", response_model=List[TagResponse])
-async def get_popular_tags(
+def get_popular_tags(
+    request: Request,
+    response: Response,
     limit: int = Query(20, ge=1, le=100, description="Number of tags to return"),
     db: Session = Depends(get_db)
 ):
@@ -706,24 +1032,31 @@ async def get_popular_tags(
     Get popular tags ordered by usage count
     """
     try:
-        # Get tags with their usage count
-        tags_with_count = db.query(
-            Tag,
-            func.count(blog_tags.c.blog_id).label('usage_count')
-        ).join(
-            blog_tags, Tag.id == blog_tags.c.tag_id, isouter=True
-        ).join(
-            Blog, blog_tags.c.blog_id == Blog.id, isouter=True
-        ).filter(
-            or_(Blog.is_published == True, Blog.id == None)
-        ).group_by(Tag.id).order_by(
-            desc('usage_count')
+        # Usage per tag over published blogs, aggregated on blog_tags alone
+        published_blog_ids = select(Blog.id).where(Blog.is_published == True)
+        usage = select(
+            blog_tags.c.tag_id,
+            func.count().label('usage_count')
+        ).where(
+            blog_tags.c.blog_id.in_(published_blog_ids)
+        ).group_by(blog_tags.c.tag_id).subquery()
+        
+        # Outer join keeps tags with no published blogs (usage 0)
+        tags = db.query(Tag).outerjoin(
+            usage, Tag.id == usage.c.tag_id
+        ).order_by(
+            desc(func.coalesce(usage.c.usage_count, 0)), asc(Tag.id)
         ).limit(limit).all()
         
-        return [TagResponse.from_orm(tag) for tag, count in tags_with_count]
+        etag = make_etag(limit, [(tag.id, tag.name, tag.color) for tag in tags])
+        not_modified = conditional_response(request, response, etag, PUBLIC_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
+        
+        return [TagResponse.model_validate(tag) for tag in tags]
         
     except Exception as e:
-        logger.error(f"Tag retrieval error: {str(e)}")
+        logger.error("Tag retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve tags"
@@ -0,0 +1,97 @@
+# app/cache.py
+from typing import Any, Optional
+import json
+import logging
+
+import redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _create_client() -> Optional[redis.Redis]:
+    """Create the shared Redis client, or None when no redis_url is configured"""
+    if not settings.redis_url:
+        return None
+    return redis.Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_timeout,
+    )
+
+
+redis_client = _create_client()
+
+
+def get_json(key: str) -> Optional[Any]:
+    """
+    Read a JSON value shared by all workers
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Decoded value, or None on a miss or when Redis is unavailable
+    """
+    if redis_client is None:
+        return None
+    try:
+        raw = redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Shared cache read failed for %s: %s", key, e)
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """
+    Store a JSON value shared by all workers
+
+    Args:
+        key: Cache key
+        value: JSON-serializable value
+        ttl_seconds: Expiry in seconds; non-positive values are not stored
+    """
+    if redis_client is None or ttl_seconds <= 0:
+        return
+    try:
+        redis_client.set(key, json.dumps(value), ex=ttl_seconds)
+    except redis.RedisError as e:
+        logger.warning("Shared cache write failed for %s: %s", key, e)
+
+
+def delete(key: str) -> None:
+    """
+    Drop a shared cache entry
+
+    Args:
+        key: Cache key
+    """
+    if redis_client is None:
+        return
+    try:
+        redis_client.delete(key)
+    except redis.RedisError as e:
+        logger.warning("Shared cache delete failed for %s: %s", key, e)
+
+
+def acquire_lock(key: str, ttl_seconds: int) -> bool:
+    """
+    Claim a short-lived lock shared by all workers (SET NX EX)
+
+    Args:
+        key: Lock key
+        ttl_seconds: Expiry in seconds; the lock is never released early
+
+    Returns:
+        True if this caller took the lock, False if another holds it or when
+        Redis is unavailable
+    """
+    if redis_client is None or ttl_seconds <= 0:
+        return False
+    try:
+        return bool(redis_client.set(key, b"1", nx=True, ex=ttl_seconds))
+    except redis.RedisError as e:
+        logger.warning("Shared cache lock failed for %s: %s", key, e)
+        return False
@@ -8,14 +8,39 @@ class Settings(BaseSettings):
     app_name: str = "Blog API"
     version: str = "1.0.0"
     debug: bool = False
+    log_level: str = "INFO"  # e.g. WARNING in production to skip per-request INFO logs
     
     # Database settings
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 20  # pool_size + overflow = 40, the threadpool size sync handlers run in
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    use_pgbouncer: bool = False  # PgBouncer does the pooling; don't hold connections here
+    db_query_cache_size: int = 1200  # Compiled SQL statements kept per engine
+    query_count_warn_threshold: int = 5  # Debug only: warn when a request runs more statements
     
     # Security settings
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    argon2_time_cost: int = 2  # Lower for dev/load tests, raise for production
+    argon2_memory_cost: int = 65536  # KiB
+    argon2_parallelism: int = 1
+    password_hash_workers: int = os.cpu_count() or 1  # Threads reserved for password hashing
+    token_cache_size: int = 10_000  # Max verified JWTs kept in memory
+    login_cache_ttl_seconds: int = 30  # Window in which a repeated login skips bcrypt
+    identity_cache_ttl_seconds: int = 300  # Cached id/email/role used by admin checks (Redis)
+    
+    # Response caches
+    category_cache_ttl_seconds: int = 60
+    profile_cache_ttl_seconds: int = 300  # Public /user/{id} profiles, shared via Redis
+    stats_cache_ttl_seconds: int = 60  # /user/my/stats, shared via Redis
+    stats_cache_fresh_seconds: int = 45  # Older cached stats are served but refreshed in the background
+    
+    # Shared cache (optional): lets all workers reuse verified tokens
+    redis_url: Optional[str] = None
+    redis_socket_timeout: float = 0.1  # Seconds; fall back to local caches when Redis is slow
     
     # CORS settings
     allowed_origins: list = ["http://localhost:3000", "http://127.0.0.1:3000"]
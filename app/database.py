@@ -1,20 +1,75 @@
 # app/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
 import logging
 from app.config import settings
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create engine with connection pooling
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,  # Verify connections before use
-    pool_recycle=300     # Recycle connections every 5 minutes
-)
+# Create engine with connection pooling. SQL is compiled once per statement
+# shape and reused from query_cache_size; filter values are always bound
+# parameters, so the number of shapes stays small
+if settings.use_pgbouncer:
+    # Transaction-mode PgBouncer owns the pool; open/close per checkout
+    engine = create_engine(
+        settings.database_url,
+        poolclass=NullPool,
+        query_cache_size=settings.db_query_cache_size
+    )
+else:
+    engine = create_engine(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=True,  # Verify connections before use
+        pool_recycle=settings.db_pool_recycle,
+        query_cache_size=settings.db_query_cache_size
+    )
+
+# Statements executed during the current request, when debug query counting
+# is on (see app.main); None outside a counted request
+request_queries: ContextVar[Optional[List[str]]] = ContextVar("request_queries", default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _record_request_query(conn, cursor, statement, parameters, context, executemany):
+    queries = request_queries.get()
+    if queries is not None:
+        queries.append(statement)
+
+
+@contextmanager
+def count_queries(conn):
+    """
+    Collect the SQL statements executed on a connection or engine
+    
+    Usage:
+        with count_queries(db.connection()) as queries:
+            ...
+        assert len(queries) <= 3
+    
+    Args:
+        conn: Connection or Engine to listen on
+        
+    Yields:
+        List that receives each executed statement
+    """
+    queries = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+    
+    event.listen(conn, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(conn, "before_cursor_execute", before_cursor_execute)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -25,7 +80,7 @@ def get_db():
     try:
         yield db
     except Exception as e:
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         db.rollback()
         raise
     finally:
@@ -36,6 +91,58 @@ def init_db():
     try:
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
+        
+        # Backfill excerpts for rows written before excerpt was required,
+        # computed in SQL so bodies never leave the database
+        with engine.begin() as conn:
+            result = conn.execute(text(
+                "UPDATE blogs SET excerpt = CASE WHEN char_length(body) > 300 "
+                "THEN LEFT(body, 297) || '...' ELSE body END "
+                "WHERE excerpt IS NULL"
+            ))
+            # Then enforce the model's NOT NULL, which ADD COLUMN left off
+            excerpt_nullable = conn.execute(text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'blogs' AND column_name = 'excerpt' AND is_nullable = 'YES'"
+            )).first()
+            if excerpt_nullable:
+                conn.execute(text("ALTER TABLE blogs ALTER COLUMN excerpt SET NOT NULL"))
+        if result.rowcount:
+            logger.info("Backfilled excerpts for %s blogs", result.rowcount)
+        
+        # Foreign keys to blogs created before they cascaded: recreate them
+        # with ON DELETE CASCADE (no-op once done)
+        with engine.begin() as conn:
+            conn.execute(text("""
+                DO $$
+                DECLARE fk record;
+                BEGIN
+                    FOR fk IN
+                        SELECT conrelid::regclass AS tbl, conname, pg_get_constraintdef(oid) AS def
+                        FROM pg_constraint
+                        WHERE contype = 'f' AND confrelid = 'blogs'::regclass AND confdeltype <> 'c'
+                          AND conrelid IN ('comments'::regclass, 'likes'::regclass, 'blog_tags'::regclass)
+                    LOOP
+                        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I, ADD CONSTRAINT %I %s ON DELETE CASCADE',
+                                       fk.tbl, fk.conname, fk.conname, fk.def);
+                    END LOOP;
+                END $$;
+            """))
+        
+        # Resync the trigger-maintained counters (only rows that drifted); the
+        # columns and triggers exist by now, create_all adds them to older databases
+        with engine.begin() as conn:
+            result = conn.execute(text(
+                "UPDATE blogs SET like_count = s.likes, comment_count = s.comments "
+                "FROM (SELECT b.id, "
+                "(SELECT count(*) FROM likes l WHERE l.blog_id = b.id) AS likes, "
+                "(SELECT count(*) FROM comments c WHERE c.blog_id = b.id AND c.is_approved) AS comments "
+                "FROM blogs b) s "
+                "WHERE blogs.id = s.id "
+                "AND (blogs.like_count, blogs.comment_count) IS DISTINCT FROM (s.likes, s.comments)"
+            ))
+        if result.rowcount:
+            logger.info("Resynced counters for %s blogs", result.rowcount)
     except Exception as e:
-        logger.error(f"Error creating database tables: {e}")
+        logger.error("Error creating database tables: %s", e)
         raise
\ No newline at end of file
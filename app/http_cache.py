@@ -0,0 +1,65 @@
+# app/http_cache.py
+from fastapi import Request, Response, status
+import hashlib
+
+# Shared data (categories, tags): browsers/CDNs may reuse it briefly
+PUBLIC_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=60"
+# Per-user data (is_liked etc.): never shared, always revalidated via ETag
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a weak ETag from the values that determine a response
+
+    Args:
+        parts: Values (ids, timestamps, counts) that change whenever the response does
+
+    Returns:
+        Weak ETag header value
+    """
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag (weak comparison)
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client already has this version
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def conditional_response(request: Request, response: Response, etag: str, cache_control: str):
+    """
+    Set caching headers and short-circuit with 304 when the client is current
+
+    Args:
+        request: Incoming request
+        response: Response the endpoint will return (headers are set on it)
+        etag: Current ETag of the resource
+        cache_control: Cache-Control header value
+
+    Returns:
+        A 304 Response if If-None-Match matches, otherwise None
+    """
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control}
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return None
@@ -1,13 +1,13 @@
 # app/main.py
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 import logging
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import get_db, init_db
+from app.database import get_db, init_db, request_queries
 from app.blog_routes import router as blog_router
 from app.user_routes import router as user_router
 from app.auth_routes import router as auth_router
@@ -16,7 +16,7 @@ from app.database import SessionLocal
 
 # Set up logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=settings.log_level,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
@@ -25,7 +25,10 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up the application...")
-    init_db()
+    # Schema setup is a deploy step in production (scripts/migrate.py), not
+    # something every worker repeats on boot
+    if settings.debug:
+        init_db()
     yield
     # Shutdown
     logger.info("Shutting down the application...")
@@ -36,6 +39,7 @@ app = FastAPI(
     
     version=settings.version,
     description="A blog API built with FastAPI",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -48,6 +52,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# In debug, count the SQL statements each request runs so N+1 regressions show up
+# in the logs (and in the X-Query-Count header) before they reach production
+if settings.debug:
+    @app.middleware("http")
+    async def count_request_queries(request: Request, call_next):
+        queries = []
+        token = request_queries.set(queries)
+        try:
+            response = await call_next(request)
+        finally:
+            request_queries.reset(token)
+        response.headers["X-Query-Count"] = str(len(queries))
+        if len(queries) > settings.query_count_warn_threshold:
+            logger.warning("%s %s ran %s queries", request.method, request.url.path, len(queries))
+        else:
+            logger.debug("%s %s ran %s queries", request.method, request.url.path, len(queries))
+        return response
+
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(blog_router, prefix="/blog", tags=["Blogs"])
@@ -74,7 +96,7 @@ async def health_check():
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    logger.error(f"Global exception: {exc}")
+    logger.error("Global exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
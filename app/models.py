@@ -1,11 +1,34 @@
 # app/models.py
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Text, Index, UniqueConstraint, DDL, Computed, desc, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import declared_attr, deferred, relationship
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.sql import text
 from app.database import Base
 
+# One shared clause for every timestamp default, so all models compile the
+# same SQL for it
+_NOW = text("CURRENT_TIMESTAMP")
 
-class User(Base):
+
+class CreatedAtMixin:
+    """created_at, filled in by the database on insert"""
+
+    @declared_attr
+    def created_at(cls):
+        return Column(DateTime(timezone=True), server_default=_NOW, nullable=False)
+
+
+class TimestampMixin(CreatedAtMixin):
+    """created_at plus updated_at; updated_at is set to CURRENT_TIMESTAMP in the UPDATE
+    statement itself unless the statement assigns it explicitly"""
+
+    @declared_attr
+    def updated_at(cls):
+        return Column(DateTime(timezone=True), server_default=_NOW, onupdate=_NOW, nullable=False)
+
+
+class User(TimestampMixin, Base):
     __tablename__ = "users"
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -14,10 +37,6 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
 
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-
     # Relationships
     blogs = relationship("Blog", back_populates="creator", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="author", cascade="all, delete-orphan")
@@ -27,7 +46,7 @@ class User(Base):
         return f"<User(id={self.id}, name='{self.name}', email='{self.email}')>"
 
 
-class Category(Base):
+class Category(TimestampMixin, Base):
     __tablename__ = "categories"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -35,10 +54,6 @@ class Category(Base):
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
     blogs = relationship("Blog", back_populates="category")
 
@@ -46,49 +61,75 @@ class Category(Base):
         return f"<Category(id={self.id}, name='{self.name}')>"
 
 
-class Blog(Base):
+class Blog(TimestampMixin, Base):
     __tablename__ = "blogs"
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False, index=True)
     body = Column(Text, nullable=False)
-    excerpt = Column(String(300), nullable=True)  # Short description
+    excerpt = Column(String(300), nullable=False)  # Short description, derived from body if not given
     is_published = Column(Boolean, default=False, nullable=False)
     is_featured = Column(Boolean, default=False, nullable=False)
     view_count = Column(Integer, default=0, nullable=False)
     
+    # Denormalized counters, kept current by triggers on likes/comments (see
+    # the end of this module); never written from Python
+    like_count = Column(Integer, server_default="0", nullable=False)
+    comment_count = Column(Integer, server_default="0", nullable=False)  # Approved only
+    
+    # Full-text search document, generated by Postgres from title + body and
+    # never loaded into Python
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(body, ''))", persisted=True)
+    ))
+    
     # Foreign Keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Timestamps (created_at/updated_at come from TimestampMixin)
     published_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     creator = relationship("User", back_populates="blogs")
     category = relationship("Category", back_populates="blogs")
-    comments = relationship("Comment", back_populates="blog", cascade="all, delete-orphan")
-    likes = relationship("Like", back_populates="blog", cascade="all, delete-orphan")
-    tags = relationship("Tag", secondary="blog_tags", back_populates="blogs")
+    # The database cascades blog deletes to comments, likes and tag links, so
+    # deleting a blog never loads those rows
+    comments = relationship("Comment", back_populates="blog", cascade="all, delete-orphan", passive_deletes=True)
+    likes = relationship("Like", back_populates="blog", cascade="all, delete-orphan", passive_deletes=True)
+    tags = relationship("Tag", secondary="blog_tags", back_populates="blogs", passive_deletes=True)
+
+    # Indexes matching the list endpoint's filter + sort shapes. view_count is
+    # deliberately not indexed: get_blog bumps it on every view, and with no
+    # index on it that UPDATE stays HOT (no index writes); sort_by=view_count
+    # sorts the filtered rows instead
+    __table_args__ = (
+        Index("ix_blog_pub_created", "is_published", desc("created_at")),
+        Index("ix_blog_cat_pub_created", "category_id", "is_published", desc("created_at")),
+        Index("ix_blog_user_created", "user_id", desc("created_at")),
+        # A user's public blogs (/user/{id}/blogs, public profile counts); drafts aren't indexed
+        Index(
+            "ix_blog_user_pub_created_id", "user_id", desc("created_at"), desc("id"),
+            postgresql_where=is_published
+        ),
+        Index("ix_blog_user_updated_id", "user_id", desc("updated_at"), desc("id")),  # /user/my/blogs cursor
+        Index("ix_blog_pub_published_at", "is_published", published_at.desc()),
+        Index("ix_blog_search", "search_vector", postgresql_using="gin"),
+    )
 
-    
 
     def __repr__(self):
         return f"<Blog(id={self.id}, title='{self.title}', author='{self.creator.name if self.creator else 'Unknown'}')>"
 
 
-class Tag(Base):
+class Tag(CreatedAtMixin, Base):
     __tablename__ = "tags"
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, nullable=False, index=True)
     color = Column(String(7), default="#007bff", nullable=False)  # Hex color code
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    
     # Relationships
     blogs = relationship("Blog", secondary="blog_tags", back_populates="tags")
 
@@ -100,13 +141,13 @@ class Tag(Base):
 from sqlalchemy import Table
 blog_tags = Table(
     'blog_tags', Base.metadata,
-    Column('blog_id', Integer, ForeignKey('blogs.id'), primary_key=True),
+    Column('blog_id', Integer, ForeignKey('blogs.id', ondelete="CASCADE"), primary_key=True),
     Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
-    Column('created_at', DateTime(timezone=True), server_default=func.now())
+    Column('created_at', DateTime(timezone=True), server_default=_NOW)
 )
 
 
-class Comment(Base):
+class Comment(TimestampMixin, Base):
     __tablename__ = "comments"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -114,43 +155,155 @@ class Comment(Base):
     is_approved = Column(Boolean, default=True, nullable=False)  # For moderation
     
     # Foreign Keys
-    blog_id = Column(Integer, ForeignKey("blogs.id"), nullable=False)
+    blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     parent_id = Column(Integer, ForeignKey("comments.id"), nullable=True)  # For nested comments
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
     blog = relationship("Blog", back_populates="comments")
     author = relationship("User", back_populates="comments")
     parent = relationship("Comment", remote_side=[id], backref="replies")
 
+    __table_args__ = (
+        Index("ix_comment_blog_parent_approved", "blog_id", "parent_id", "is_approved"),
+        Index("ix_comment_user_created_id", "user_id", desc("created_at"), desc("id")),  # /user/my/comments cursor
+    )
+
     def __repr__(self):
         return f"<Comment(id={self.id}, blog_id={self.blog_id}, author='{self.author.name if self.author else 'Unknown'}')>"
 
 
-class Like(Base):
+class Like(CreatedAtMixin, Base):
     __tablename__ = "likes"
 
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign Keys
-    blog_id = Column(Integer, ForeignKey("blogs.id"), nullable=False)
+    blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    
     # Relationships
     blog = relationship("Blog", back_populates="likes")
     user = relationship("User", back_populates="likes")
     
     # Unique constraint to prevent duplicate likes
     __table_args__ = (
+        UniqueConstraint("blog_id", "user_id", name="uq_like_blog_user"),
+        Index("ix_like_user_blog", "user_id", "blog_id"),  # a user's liked blogs
         {'extend_existing': True},
     )
 
     def __repr__(self):
-        return f"<Like(id={self.id}, blog_id={self.blog_id}, user_id={self.user_id})>"
\ No newline at end of file
+        return f"<Like(id={self.id}, blog_id={self.blog_id}, user_id={self.user_id})>"
+
+
+# create_all only creates missing tables, so columns and indexes added to
+# existing tables since are brought in here; metadata-level after_create runs
+# on every create_all, and each step is a no-op once applied
+_ADDED_COLUMNS = (
+    Blog.__table__.c.search_vector,
+    Blog.__table__.c.like_count,
+    Blog.__table__.c.comment_count,
+)
+# Indexes that older versions created and that are no longer wanted
+_DROPPED_INDEXES = (
+    "ix_blog_pub_views",  # Made every view-count bump a non-HOT update
+    "ix_users_active",  # Duplicated the primary key index
+    "ix_like_blog_user",  # Replaced by the uq_like_blog_user constraint
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _upgrade_existing_tables(target, connection, **kw):
+    if connection.dialect.name != "postgresql":
+        return
+    for column in _ADDED_COLUMNS:
+        column_ddl = CreateColumn(column).compile(dialect=connection.dialect)
+        connection.execute(text(f"ALTER TABLE {column.table.name} ADD COLUMN IF NOT EXISTS {column_ddl}"))
+    
+    # Likes written before the (blog_id, user_id) key existed can be doubled
+    # (the old read-then-write toggle raced); keep the oldest of each pair,
+    # then add the key the like toggle's ON CONFLICT relies on
+    has_like_key = connection.execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = 'uq_like_blog_user'")
+    ).first()
+    if not has_like_key:
+        connection.execute(text(
+            "DELETE FROM likes a USING likes b "
+            "WHERE a.blog_id = b.blog_id AND a.user_id = b.user_id AND a.id > b.id"
+        ))
+        connection.execute(text(
+            "ALTER TABLE likes ADD CONSTRAINT uq_like_blog_user UNIQUE (blog_id, user_id)"
+        ))
+    
+    for table in target.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+    for index_name in _DROPPED_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+
+# Trigram index so ILIKE '%term%' searches on title can use an index. Created
+# only where the pg_trgm extension is installable; otherwise search still works
+# via a sequential scan.
+event.listen(
+    Blog.__table__,
+    "after_create",
+    DDL("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX IF NOT EXISTS ix_blog_title_trgm ON blogs USING gin (title gin_trgm_ops);
+            END IF;
+        END $$;
+    """).execute_if(dialect="postgresql")
+)
+
+
+# Keep blogs.like_count in step with likes. Registered on the metadata (after
+# the column upgrade above) and written to be re-runnable, so existing
+# databases get the trigger too; init_db resyncs the counts afterwards
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION blogs_sync_like_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE blogs SET like_count = like_count + 1 WHERE id = NEW.blog_id;
+            ELSE
+                UPDATE blogs SET like_count = like_count - 1 WHERE id = OLD.blog_id;
+            END IF;
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql;
+        
+        DROP TRIGGER IF EXISTS trg_likes_like_count ON likes;
+        CREATE TRIGGER trg_likes_like_count
+            AFTER INSERT OR DELETE ON likes
+            FOR EACH ROW EXECUTE FUNCTION blogs_sync_like_count();
+    """).execute_if(dialect="postgresql")
+)
+
+# Keep blogs.comment_count in step with approved comments (same setup)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION blogs_sync_comment_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.is_approved THEN
+                UPDATE blogs SET comment_count = comment_count - 1 WHERE id = OLD.blog_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.is_approved THEN
+                UPDATE blogs SET comment_count = comment_count + 1 WHERE id = NEW.blog_id;
+            END IF;
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql;
+        
+        DROP TRIGGER IF EXISTS trg_comments_comment_count ON comments;
+        CREATE TRIGGER trg_comments_comment_count
+            AFTER INSERT OR DELETE OR UPDATE OF is_approved, blog_id ON comments
+            FOR EACH ROW EXECUTE FUNCTION blogs_sync_comment_count();
+    """).execute_if(dialect="postgresql")
+)
@@ -1,8 +1,12 @@
 # app/schemas.py
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints, WithJsonSchema, field_validator
+from typing import Annotated, Dict, Literal, Optional, List, Union
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+import re
+
+from email_validator import EmailNotValidError, validate_email
 
 
 # ===============================
@@ -32,24 +36,49 @@ class PaginationResponse(BaseModel):
 # USER SCHEMAS
 # ===============================
 
+@lru_cache(maxsize=4096)
+def _normalize_email(value: str) -> str:
+    """Syntax-check and normalize an email (no DNS lookups); repeat logins hit the cache"""
+    try:
+        return validate_email(value, check_deliverability=False).normalized
+    except EmailNotValidError as e:
+        raise ValueError(f"value is not a valid email address: {e}")
+
+
+# Drop-in for EmailStr: same checks and normalization, memoized per address
+CachedEmail = Annotated[
+    str,
+    AfterValidator(_normalize_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
 class UserBase(BaseModel):
-    name: str = Field(..., min_length=2, max_length=100, description="User's full name")
-    email: EmailStr = Field(..., description="User's email address")
-    
-    @validator('name')
-    def validate_name(cls, v):
-        if not v.strip():
-            raise ValueError('Name cannot be empty or just whitespace')
-        return v.strip()
+    # Stripped in pydantic-core before the length check, so blank names fail min_length
+    name: Annotated[str, StringConstraints(strip_whitespace=True)] = Field(
+        ..., min_length=2, max_length=100, description="User's full name"
+    )
+    email: CachedEmail = Field(..., description="User's email address")
+
+
+# One C-level scan that accepts any password passing UserCreate's rules; the
+# ASCII classes are subsets of the str methods, so a match is always valid.
+# (Not a Field pattern: pydantic-core's regex engine has no lookaheads, and
+# each rule keeps its own error message.) Length is left to Field's min_length,
+# which pydantic-core enforces before this validator runs.
+_PASSWORD_RULES_RE = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)", re.DOTALL)
 
 
 class UserCreate(UserBase):
     password: str = Field(..., min_length=6, max_length=100, description="User's password")
     
-    @validator('password')
-    def validate_password(cls, v):
-        if len(v) < 6:
-            raise ValueError('Password must be at least 6 characters long')
+    @field_validator('password', mode='after')
+    @classmethod
+    def validate_password(cls, v: str) -> str:
+        if _PASSWORD_RULES_RE.match(v):
+            return v
+        
+        # Slow path only to find which rule failed (or to accept non-ASCII letters)
         if not any(c.isupper() for c in v):
             raise ValueError('Password must contain at least one uppercase letter')
         if not any(c.islower() for c in v):
@@ -61,7 +90,7 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=100)
-    email: Optional[EmailStr] = None
+    email: Optional[CachedEmail] = None
     is_active: Optional[bool] = None
 
 
@@ -74,6 +103,29 @@ class UserResponse(UserBase):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_orm_trusted(cls, user, **extra):
+        """
+        Build the response from a DB row without re-validating it
+        
+        Args:
+            user: User row (validated when it was written)
+            extra: Values for subclass fields, e.g. UserWithStats counts
+            
+        Returns:
+            Instance of cls
+        """
+        return cls.model_construct(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            is_active=user.is_active,
+            is_admin=user.is_admin,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            **extra
+        )
 
 
 class UserWithStats(UserResponse):
@@ -88,13 +140,13 @@ class UserWithStats(UserResponse):
 # ===============================
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: CachedEmail
     password: str
 
 
 class Token(BaseModel):
     access_token: str
-    token_type: str = "bearer"
+    token_type: Literal["bearer"] = "bearer"
     expires_in: int
     user: UserResponse
 
@@ -212,9 +264,38 @@ class BlogWithStats(BlogResponse):
     is_liked: bool = False  # Whether current user liked this blog
 
 
+class BlogSummary(BaseModel):
+    """Blog fields for list views; the excerpt stands in for the full body"""
+    id: int
+    title: str
+    excerpt: Optional[str] = None
+    category_id: Optional[int] = None
+    is_published: bool
+    is_featured: bool
+    view_count: int
+    created_at: datetime
+    updated_at: datetime
+    published_at: Optional[datetime]
+    
+    # Related objects
+    creator: UserResponse
+    category: Optional[CategoryResponse] = None
+    tags: List[TagResponse] = []
+    
+    class Config:
+        from_attributes = True
+
+
+class BlogSummaryWithStats(BlogSummary):
+    """Blog list item with additional statistics"""
+    comment_count: int = 0
+    like_count: int = 0
+    is_liked: bool = False  # Whether current user liked this blog
+
+
 class BlogListResponse(BaseModel):
     """Response for blog list with pagination"""
-    blogs: List[BlogWithStats]
+    blogs: List[BlogSummaryWithStats]
     pagination: PaginationResponse
 
 
@@ -254,7 +335,6 @@ class CommentResponse(CommentBase):
 # Fix forward reference for nested comments
 CommentResponse.model_rebuild()
 
-
 # ===============================
 # LIKE SCHEMAS
 # ===============================
@@ -289,6 +369,12 @@ class PaginationParams(BaseModel):
     per_page: int = Field(10, ge=1, le=100, description="Items per page")
 
 
+class KeysetParams(BaseModel):
+    """Keyset (seek) pagination cursor; when set, it replaces page"""
+    last_at: Optional[datetime] = Field(None, description="Sort timestamp of the last item already received")
+    last_id: Optional[int] = Field(None, description="ID of the last item already received")
+
+
 # ===============================
 # BULK OPERATION SCHEMAS
 # ===============================
@@ -298,10 +384,18 @@ class BulkDeleteRequest(BaseModel):
     ids: List[int] = Field(..., min_items=1, description="List of IDs to delete")
 
 
+class BulkUpdatePayload(BaseModel):
+    """Fields that may be changed on many blogs at once"""
+    title: Optional[str] = Field(None, min_length=5, max_length=200)
+    category_id: Optional[int] = None
+    is_published: Optional[bool] = None
+    is_featured: Optional[bool] = None
+
+
 class BulkUpdateRequest(BaseModel):
     """Bulk update request"""
     ids: List[int] = Field(..., min_items=1, description="List of IDs to update")
-    data: dict = Field(..., description="Update data")
+    data: BulkUpdatePayload = Field(..., description="Update data")
 
 
 
@@ -332,5 +426,5 @@ class ErrorResponse(BaseModel):
     """Error response schema"""
     success: bool = False
     message: str
-    details: Optional[dict] = None
+    details: Optional[Dict[str, Union[str, int, float, bool, None]]] = None
     error_code: Optional[str] = None
\ No newline at end of file
@@ -1,28 +1,177 @@
 # app/user_routes.py
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload, aliased
-from sqlalchemy import desc, func
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.orm import Session, joinedload, selectinload, aliased
+from sqlalchemy import delete, desc, func, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
 import logging
+import time
 
-from app.database import get_db
+from app import cache
+from app.config import settings
+from app.database import SessionLocal, get_db
 from app.models import User, Blog, Comment, Like
 from app.schemas import (
     UserResponse, UserWithStats, UserUpdate, BaseResponse,
-    BlogResponse, PaginationParams, PaginationResponse
+    BlogResponse, PaginationParams, PaginationResponse, KeysetParams
+)
+from app.http_cache import (
+    PRIVATE_CACHE_CONTROL, PUBLIC_CACHE_CONTROL, conditional_response, make_etag
+)
+from app.auth import CurrentIdentity, get_current_user, require_admin, AuthService
+from app.blog_routes import (
+    LAZY_LOAD_GUARD, blog_payload, invalidate_category_cache, invalidate_user_stats,
+    stats_cache_key, trusted_json_response
 )
-from app.auth import get_current_user, AuthService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def blog_list_response(blogs: List[Blog], response: Response) -> Response:
+    """
+    Encode a page of blogs straight to JSON with orjson
+    
+    The rows come from our own database, so they skip Pydantic validation;
+    response_model on the route still documents the shape.
+    
+    Args:
+        blogs: Blogs with creator, category and tags loaded
+        response: The endpoint's injected response, whose headers are kept
+        
+    Returns:
+        JSON response matching List[BlogResponse]
+    """
+    return trusted_json_response([blog_payload(blog) for blog in blogs], response)
+
+
+def fetch_page(query, sort_column, id_column, pagination: PaginationParams, keyset: KeysetParams) -> list:
+    """
+    Fetch one page, newest first, by keyset cursor when given, else by page number
+    
+    With a cursor the database seeks straight past the last item seen (an
+    index range scan) instead of reading and discarding every earlier row.
+    
+    Args:
+        query: Filtered query without ORDER BY or LIMIT
+        sort_column: Timestamp column the list is ordered by
+        id_column: Primary key column, the tiebreaker for equal timestamps
+        pagination: Page size and page number (page is ignored with a cursor)
+        keyset: Sort timestamp and id of the last item already received
+        
+    Returns:
+        Rows of the page
+    """
+    query = query.order_by(desc(sort_column), desc(id_column))
+    
+    if keyset.last_at is not None and keyset.last_id is not None:
+        query = query.filter(
+            tuple_(sort_column, id_column) < tuple_(keyset.last_at, keyset.last_id)
+        )
+    else:
+        query = query.offset((pagination.page - 1) * pagination.per_page)
+    
+    return query.limit(pagination.per_page).all()
+
+
+def update_user_returning(db: Session, user_id: int, values: dict):
+    """
+    Apply a user update and read back the response fields in one statement
+    
+    UPDATE ... RETURNING replaces the SELECT / UPDATE / refresh round trips.
+    The old email comes from a subquery in RETURNING, which still sees the
+    row as it was before this statement.
+    
+    Args:
+        db: Database session
+        user_id: User to update
+        values: Column values to set (may be empty)
+        
+    Returns:
+        Row with the UserResponse fields plus old_email, or None if the user
+        doesn't exist
+        
+    Raises:
+        IntegrityError: If the new email is already registered
+    """
+    previous = aliased(User)
+    old_email = select(previous.email).where(previous.id == user_id).scalar_subquery()
+    columns = (
+        User.id, User.name, User.email, User.is_active,
+        User.is_admin, User.created_at, User.updated_at, old_email.label("old_email")
+    )
+    
+    if not values:
+        return db.execute(select(*columns).where(User.id == user_id)).first()
+    return db.execute(
+        update(User).where(User.id == user_id).values(**values).returning(*columns),
+        execution_options={"synchronize_session": False}
+    ).first()
+
+
+def is_email_conflict(error: IntegrityError) -> bool:
+    """Whether an IntegrityError is the unique index on users.email rejecting a taken address"""
+    diag = getattr(error.orig, "diag", None)
+    return getattr(diag, "constraint_name", None) == "ix_users_email"
+
+
+def profile_cache_key(user_id: int) -> str:
+    """Shared cache key for a user's public profile"""
+    return f"user_profile:{user_id}"
+
+
+def profile_etag(profile: dict) -> str:
+    """Weak ETag for a UserWithStats payload: profile edits and count changes alter it"""
+    return make_etag(
+        profile["id"], profile["updated_at"],
+        profile["blog_count"], profile["comment_count"], profile["like_count"]
+    )
+
+
+def user_stat_columns(user_id: int, published_only: bool = False) -> tuple:
+    """
+    A user's blog, comment and received-like counts as scalar subqueries,
+    so they can be selected together (and alongside the user) in one query
+    
+    Args:
+        user_id: User whose content is counted
+        published_only: Count only public content (published blogs, approved
+            comments on published blogs, likes on published blogs)
+        
+    Returns:
+        Tuple of (blog_count, comment_count, like_count) column expressions
+    """
+    blog_count = select(func.count(Blog.id)).where(Blog.user_id == user_id)
+    comment_count = select(func.count(Comment.id)).where(Comment.user_id == user_id)
+    # Likes received: sum of the per-blog counters rather than counting likes
+    like_count = select(func.coalesce(func.sum(Blog.like_count), 0)).where(
+        Blog.user_id == user_id
+    )
+    
+    if published_only:
+        blog_count = blog_count.where(Blog.is_published == True)
+        comment_count = comment_count.join(Blog, Comment.blog_id == Blog.id).where(
+            Blog.is_published == True,
+            Comment.is_approved == True
+        )
+        like_count = like_count.where(Blog.is_published == True)
+    
+    # correlate(None): never bind to an enclosing query's blogs/users
+    return (
+        blog_count.correlate(None).scalar_subquery().label("blog_count"),
+        comment_count.correlate(None).scalar_subquery().label("comment_count"),
+        like_count.correlate(None).scalar_subquery().label("like_count"),
+    )
+
+
 
 # USER PROFILE ENDPOINTS
 
 
 @router.get("/profile", response_model=UserWithStats)
-async def get_my_profile(
+def get_my_profile(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -35,23 +184,25 @@ async def get_my_profile(
     - Total number of likes received on blogs
     """
     try:
-        # Get user statistics
-        blog_count = db.query(Blog).filter(Blog.user_id == current_user.id).count()
-        comment_count = db.query(Comment).filter(Comment.user_id == current_user.id).count()
-        
-        # Get total likes received on user's blogs
-        like_count = db.query(Like).join(Blog).filter(Blog.user_id == current_user.id).count()
-        
-        user_data = UserResponse.from_orm(current_user)
-        return UserWithStats(
-            **user_data.dict(),
+        # Blogs, comments made and likes received, in one round trip
+        blog_count, comment_count, like_count = db.execute(
+            select(*user_stat_columns(current_user.id))
+        ).one()
+        
+        etag = make_etag(current_user.id, current_user.updated_at, blog_count, comment_count, like_count)
+        not_modified = conditional_response(request, response, etag, PRIVATE_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
+        
+        return UserWithStats.from_orm_trusted(
+            current_user,
             blog_count=blog_count,
             comment_count=comment_count,
             like_count=like_count
         )
         
     except Exception as e:
-        logger.error(f"Profile retrieval error: {str(e)}")
+        logger.error("Profile retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve profile"
@@ -59,7 +210,7 @@ async def get_my_profile(
 
 
 @router.put("/profile", response_model=UserResponse)
-async def update_my_profile(
+def update_my_profile(
     user_data: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -73,32 +224,42 @@ async def update_my_profile(
     Note: Only the user can update their own profile
     """
     try:
-        update_data = user_data.dict(exclude_unset=True)
-        
-        # Check if email is being updated and if it's already taken
-        if "email" in update_data and update_data["email"] != current_user.email:
-            existing_user = db.query(User).filter(User.email == update_data["email"]).first()
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-        
-        # Update user fields
-        for field, value in update_data.items():
-            setattr(current_user, field, value)
-        
+        # No uniqueness pre-check: the unique index on email rejects a taken
+        # address, which is_email_conflict recognizes below
+        user = update_user_returning(
+            db, current_user.id, user_data.model_dump(exclude_unset=True)
+        )
         db.commit()
-        db.refresh(current_user)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        AuthService.invalidate_login_cache(user.old_email)
+        AuthService.invalidate_identity(user.id)
+        cache.delete(profile_cache_key(user.id))
         
-        logger.info(f"Profile updated: {current_user.email}")
+        logger.info("Profile updated: %s", user.email)
         
-        return UserResponse.from_orm(current_user)
+        return UserResponse.from_orm_trusted(user)
         
+    except IntegrityError as e:
+        db.rollback()
+        if not is_email_conflict(e):
+            logger.error("Profile update error: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to update profile"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Profile update error: {str(e)}")
+        logger.error("Profile update error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -110,7 +271,9 @@ async def update_my_profile(
 
 
 @router.get("/{user_id}", response_model=UserWithStats)
-async def get_user_by_id(
+def get_user_by_id(
+    request: Request,
+    response: Response,
     user_id: int,
     db: Session = Depends(get_db)
 ):
@@ -119,47 +282,45 @@ async def get_user_by_id(
     
     Returns basic user information and public statistics
     """
+    cached = cache.get_json(profile_cache_key(user_id))
+    if cached is not None:
+        not_modified = conditional_response(request, response, profile_etag(cached), PUBLIC_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
+        return trusted_json_response(cached, response)
+    
     try:
-        user = db.query(User).filter(
+        # The user and their public statistics in one query
+        row = db.query(User, *user_stat_columns(user_id, published_only=True)).filter(
             User.id == user_id,
             User.is_active == True
         ).first()
         
-        if not user:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
+        user, blog_count, comment_count, like_count = row
         
-        # Get user statistics (only for published content)
-        blog_count = db.query(Blog).filter(
-            Blog.user_id == user.id,
-            Blog.is_published == True
-        ).count()
-        
-        comment_count = db.query(Comment).join(Blog).filter(
-            Comment.user_id == user.id,
-            Blog.is_published == True,
-            Comment.is_approved == True
-        ).count()
-        
-        like_count = db.query(Like).join(Blog).filter(
-            Blog.user_id == user.id,
-            Blog.is_published == True
-        ).count()
-        
-        user_data = UserResponse.from_orm(user)
-        return UserWithStats(
-            **user_data.dict(),
+        profile = UserWithStats.from_orm_trusted(
+            user,
             blog_count=blog_count,
             comment_count=comment_count,
             like_count=like_count
-        )
+        ).model_dump(mode="json")
+        cache.set_json(profile_cache_key(user_id), profile, settings.profile_cache_ttl_seconds)
+        
+        # Same ETag whether the profile came from the database or the cache
+        not_modified = conditional_response(request, response, profile_etag(profile), PUBLIC_CACHE_CONTROL)
+        if not_modified is not None:
+            return not_modified
+        return trusted_json_response(profile, response)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"User retrieval error: {str(e)}")
+        logger.error("User retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user"
@@ -171,8 +332,10 @@ async def get_user_by_id(
 # USER'S OWN CONTENT MANAGEMENT
 
 @router.get("/my/blogs", response_model=List[BlogResponse])
-async def get_my_blogs(
+def get_my_blogs(
+    response: Response,
     pagination: PaginationParams = Depends(),
+    keyset: KeysetParams = Depends(),
     is_published: Optional[bool] = Query(None, description="Filter by publication status"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -183,6 +346,7 @@ async def get_my_blogs(
     - **is_published**: Filter by publication status (optional)
     - **page**: Page number
     - **per_page**: Items per page
+    - **last_at** / **last_id**: updated_at and id of the last blog received (cursor)
     
     Returns all blogs created by the current user (published and unpublished)
     """
@@ -190,24 +354,21 @@ async def get_my_blogs(
         query = db.query(Blog).options(
             joinedload(Blog.creator),
             joinedload(Blog.category),
-            joinedload(Blog.tags)
+            selectinload(Blog.tags),
+            *LAZY_LOAD_GUARD
         ).filter(Blog.user_id == current_user.id)
         
         # Apply publication filter if specified
         if is_published is not None:
             query = query.filter(Blog.is_published == is_published)
         
-        # Order by update date (most recently updated first)
-        query = query.order_by(desc(Blog.updated_at))
-        
-        # Apply pagination
-        offset = (pagination.page - 1) * pagination.per_page
-        blogs = query.offset(offset).limit(pagination.per_page).all()
+        # Most recently updated first
+        blogs = fetch_page(query, Blog.updated_at, Blog.id, pagination, keyset)
         
-        return [BlogResponse.from_orm(blog) for blog in blogs]
+        return blog_list_response(blogs, response)
         
     except Exception as e:
-        logger.error(f"My blogs retrieval error: {str(e)}")
+        logger.error("My blogs retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve your blogs"
@@ -218,9 +379,11 @@ async def get_my_blogs(
 
 
 @router.get("/{user_id}/blogs", response_model=List[BlogResponse])
-async def get_user_blogs(
+def get_user_blogs(
+    response: Response,
     user_id: int,
     pagination: PaginationParams = Depends(),
+    keyset: KeysetParams = Depends(),
     published_only: bool = Query(True, description="Show only published blogs"),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user)
@@ -232,6 +395,7 @@ async def get_user_blogs(
     - **published_only**: Show only published blogs (default: true)
     - **page**: Page number
     - **per_page**: Items per page
+    - **last_at** / **last_id**: created_at and id of the last blog received (cursor)
     
     Note: Users can see their own unpublished blogs, others can only see published blogs
     """
@@ -247,26 +411,23 @@ async def get_user_blogs(
         query = db.query(Blog).options(
             joinedload(Blog.creator),
             joinedload(Blog.category),
-            joinedload(Blog.tags)
+            selectinload(Blog.tags),
+            *LAZY_LOAD_GUARD
         ).filter(Blog.user_id == user_id)
         
         # Apply publication filter
         if published_only or (current_user and current_user.id != user_id):
             query = query.filter(Blog.is_published == True)
         
-        # Order by creation date (newest first)
-        query = query.order_by(desc(Blog.created_at))
+        # Newest first
+        blogs = fetch_page(query, Blog.created_at, Blog.id, pagination, keyset)
         
-        # Apply pagination
-        offset = (pagination.page - 1) * pagination.per_page
-        blogs = query.offset(offset).limit(pagination.per_page).all()
-        
-        return [BlogResponse.from_orm(blog) for blog in blogs]
+        return blog_list_response(blogs, response)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"User blogs retrieval error: {str(e)}")
+        logger.error("User blogs retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user blogs"
@@ -276,8 +437,89 @@ async def get_user_blogs(
 
 
 
+def load_user_stats(db: Session, user_id: int) -> dict:
+    """
+    Compute the /user/my/stats payload
+    
+    Args:
+        db: Database session
+        user_id: User whose statistics are computed
+        
+    Returns:
+        Blog, engagement and most-popular-blog statistics
+    """
+    # Every count in one statement: blog aggregates (including the per-blog
+    # like/comment counters) in a single pass over the user's blogs, and
+    # comments made as a scalar subquery
+    _, comments_made, _ = user_stat_columns(user_id)
+    
+    (
+        total_blogs, published_blogs, featured_blogs, total_views,
+        total_likes, total_comments, comments_made
+    ) = db.execute(
+        select(
+            func.count(Blog.id),
+            func.count(Blog.id).filter(Blog.is_published == True),
+            func.count(Blog.id).filter(Blog.is_featured == True),
+            func.coalesce(func.sum(Blog.view_count), 0),
+            func.coalesce(func.sum(Blog.like_count), 0),
+            func.coalesce(func.sum(Blog.comment_count), 0),
+            comments_made
+        ).where(Blog.user_id == user_id)
+    ).one()
+    draft_blogs = total_blogs - published_blogs
+    
+    # Most popular blog (just the three fields shown, never the body)
+    most_popular_blog = db.query(Blog.id, Blog.title, Blog.view_count).filter(
+        Blog.user_id == user_id,
+        Blog.is_published == True
+    ).order_by(desc(Blog.view_count)).first()
+    
+    return {
+        "blog_stats": {
+            "total_blogs": total_blogs,
+            "published_blogs": published_blogs,
+            "draft_blogs": draft_blogs,
+            "featured_blogs": featured_blogs
+        },
+        "engagement_stats": {
+            "total_views": total_views,
+            "total_likes": total_likes,
+            "total_comments_received": total_comments,
+            "total_comments_made": comments_made
+        },
+        "most_popular_blog": {
+            "id": most_popular_blog.id if most_popular_blog else None,
+            "title": most_popular_blog.title if most_popular_blog else None,
+            "view_count": most_popular_blog.view_count if most_popular_blog else 0
+        }
+    }
+
+
+def store_user_stats(user_id: int, stats: dict) -> None:
+    """Cache a user's stats in the shared cache, stamped with when they were computed"""
+    cache.set_json(
+        stats_cache_key(user_id),
+        {"computed_at": time.time(), "stats": stats},
+        settings.stats_cache_ttl_seconds
+    )
+
+
+def refresh_user_stats(user_id: int) -> None:
+    """Recompute and re-cache a user's stats (background task, own session)"""
+    db = SessionLocal()
+    try:
+        store_user_stats(user_id, load_user_stats(db, user_id))
+    except Exception as e:
+        logger.warning("Background stats refresh failed for user %s: %s", user_id, e)
+    finally:
+        db.close()
+
+
 @router.get("/my/stats", response_model=dict)
-async def get_my_detailed_stats(
+def get_my_detailed_stats(
+    response: Response,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -288,67 +530,30 @@ async def get_my_detailed_stats(
     - Blog statistics (total, published, drafts, featured)
     - Engagement statistics (total views, likes, comments)
     - Recent activity summary
+    
+    Served from the shared cache for up to stats_cache_ttl_seconds; entries
+    older than stats_cache_fresh_seconds are returned as-is and refreshed
+    after the response is sent (stale-while-revalidate).
     """
+    cached = cache.get_json(stats_cache_key(current_user.id))
+    if cached is not None:
+        is_stale = time.time() - cached["computed_at"] > settings.stats_cache_fresh_seconds
+        # Single flight: only the request that takes the refresh lock queues a
+        # recompute; the lock lasts until the stale entry would expire anyway
+        if is_stale and cache.acquire_lock(
+            f"{stats_cache_key(current_user.id)}:refresh",
+            settings.stats_cache_ttl_seconds - settings.stats_cache_fresh_seconds
+        ):
+            background_tasks.add_task(refresh_user_stats, current_user.id)
+        return trusted_json_response(cached["stats"], response)
+    
     try:
-        # Blog statistics
-        total_blogs = db.query(Blog).filter(Blog.user_id == current_user.id).count()
-        published_blogs = db.query(Blog).filter(
-            Blog.user_id == current_user.id,
-            Blog.is_published == True
-        ).count()
-        draft_blogs = total_blogs - published_blogs
-        featured_blogs = db.query(Blog).filter(
-            Blog.user_id == current_user.id,
-            Blog.is_featured == True
-        ).count()
-        
-        # Engagement statistics
-        total_views = db.query(func.sum(Blog.view_count)).filter(
-            Blog.user_id == current_user.id
-        ).scalar() or 0
-        
-        total_likes = db.query(Like).join(Blog).filter(
-            Blog.user_id == current_user.id
-        ).count()
-        
-        total_comments = db.query(Comment).join(Blog).filter(
-            Blog.user_id == current_user.id,
-            Comment.is_approved == True
-        ).count()
-        
-        # Comments made by user
-        comments_made = db.query(Comment).filter(
-            Comment.user_id == current_user.id
-        ).count()
-        
-        # Most popular blog
-        most_popular_blog = db.query(Blog).filter(
-            Blog.user_id == current_user.id,
-            Blog.is_published == True
-        ).order_by(desc(Blog.view_count)).first()
-        
-        return {
-            "blog_stats": {
-                "total_blogs": total_blogs,
-                "published_blogs": published_blogs,
-                "draft_blogs": draft_blogs,
-                "featured_blogs": featured_blogs
-            },
-            "engagement_stats": {
-                "total_views": total_views,
-                "total_likes": total_likes,
-                "total_comments_received": total_comments,
-                "total_comments_made": comments_made
-            },
-            "most_popular_blog": {
-                "id": most_popular_blog.id if most_popular_blog else None,
-                "title": most_popular_blog.title if most_popular_blog else None,
-                "view_count": most_popular_blog.view_count if most_popular_blog else 0
-            }
-        }
+        stats = load_user_stats(db, current_user.id)
+        store_user_stats(current_user.id, stats)
+        return trusted_json_response(stats, response)
         
     except Exception as e:
-        logger.error(f"User stats retrieval error: {str(e)}")
+        logger.error("User stats retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve statistics"
@@ -356,7 +561,7 @@ async def get_my_detailed_stats(
 
 
 @router.delete("/my/blogs/{blog_id}", response_model=BaseResponse)
-async def delete_my_blog(
+def delete_my_blog(
     blog_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -369,22 +574,28 @@ async def delete_my_blog(
     Only the blog author can delete their own blog
     """
     try:
-        blog = db.query(Blog).filter(
-            Blog.id == blog_id,
-            Blog.user_id == current_user.id
+        # Ownership check and delete in one statement; comments, likes and
+        # tag links go with it via ON DELETE CASCADE
+        deleted = db.execute(
+            delete(Blog).where(
+                Blog.id == blog_id,
+                Blog.user_id == current_user.id
+            ).returning(Blog.title),
+            execution_options={"synchronize_session": False}
         ).first()
         
-        if not blog:
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found or you don't have permission to delete it"
             )
         
-        blog_title = blog.title
-        db.delete(blog)
+        blog_title = deleted.title
         db.commit()
+        invalidate_category_cache()
+        invalidate_user_stats(current_user.id)
         
-        logger.info(f"Blog deleted by owner: {blog_title} by {current_user.email}")
+        logger.info("Blog deleted by owner: %s by %s", blog_title, current_user.email)
         
         return BaseResponse(
             success=True,
@@ -394,7 +605,7 @@ async def delete_my_blog(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Blog deletion error: {str(e)}")
+        logger.error("Blog deletion error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -406,8 +617,10 @@ async def delete_my_blog(
 # USER ACTIVITY ENDPOINT
 
 @router.get("/my/liked-blogs", response_model=List[BlogResponse])
-async def get_my_liked_blogs(
+def get_my_liked_blogs(
+    response: Response,
     pagination: PaginationParams = Depends(),
+    keyset: KeysetParams = Depends(),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -415,23 +628,30 @@ async def get_my_liked_blogs(
     Get blogs liked by current user
     
     Returns list of published blogs that the current user has liked
+    
+    - **last_at** / **last_id**: updated_at and id of the last blog received (cursor)
     """
     try:
-        # Get blogs liked by the user
-        liked_blogs_query = db.query(Blog).filter(
-            Blog.is_published == True,
-            Blog.likes.any(Like.user_id == current_user.id)
-        ).order_by(desc(Blog.updated_at)).distinct()
-       
-       
-        # Apply pagination
-        offset = (pagination.page - 1) * pagination.per_page
-        liked_blogs = liked_blogs_query.offset(offset).limit(pagination.per_page).all()
+        # Get blogs liked by the user; (blog_id, user_id) is unique, so the
+        # join yields each blog at most once and needs no DISTINCT
+        liked_blogs_query = db.query(Blog).join(
+            Like, Like.blog_id == Blog.id
+        ).options(
+            joinedload(Blog.creator),
+            joinedload(Blog.category),
+            selectinload(Blog.tags),
+            *LAZY_LOAD_GUARD
+        ).filter(
+            Like.user_id == current_user.id,
+            Blog.is_published == True
+        )
         
-        return [BlogResponse.from_orm(blog) for blog in liked_blogs]
+        liked_blogs = fetch_page(liked_blogs_query, Blog.updated_at, Blog.id, pagination, keyset)
+        
+        return blog_list_response(liked_blogs, response)
         
     except Exception as e:
-        logger.error(f"Liked blogs retrieval error: {str(e)}")
+        logger.error("Liked blogs retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve liked blogs"
@@ -439,8 +659,10 @@ async def get_my_liked_blogs(
 
 
 @router.get("/my/comments", response_model=List[dict])
-async def get_my_comments(
+def get_my_comments(
+    response: Response,
     pagination: PaginationParams = Depends(),
+    keyset: KeysetParams = Depends(),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -448,38 +670,45 @@ async def get_my_comments(
     Get comments made by current user
     
     Returns list of comments made by the current user on published blogs
+    
+    - **last_at** / **last_id**: created_at and id of the last comment received (cursor)
     """
     try:
-        comments_query = db.query(Comment).options(
-            joinedload(Comment.blog).joinedload(Blog.creator)
-        ).join(Blog).filter(
+        # Select exactly the fields the response shows as plain rows: one
+        # query, and no ORM objects to build for comments, blogs or authors
+        comments_query = db.query(
+            Comment.id,
+            Comment.content,
+            Comment.created_at,
+            Blog.id.label("blog_id"),
+            Blog.title.label("blog_title"),
+            User.name.label("blog_author")
+        ).join(
+            Blog, Comment.blog_id == Blog.id
+        ).join(
+            User, Blog.user_id == User.id
+        ).filter(
             Comment.user_id == current_user.id,
             Blog.is_published == True,
             Comment.is_approved == True
-        ).order_by(desc(Comment.created_at))
-        
-        # Apply pagination
-        offset = (pagination.page - 1) * pagination.per_page
-        comments = comments_query.offset(offset).limit(pagination.per_page).all()
-        
-        # Format response with blog information
-        comment_list = []
-        for comment in comments:
-            comment_list.append({
-                "id": comment.id,
-                "content": comment.content,
-                "created_at": comment.created_at,
-                "blog": {
-                    "id": comment.blog.id,
-                    "title": comment.blog.title,
-                    "author": comment.blog.creator.name
-                }
-            })
-        
-        return comment_list
+        )
+        
+        rows = fetch_page(comments_query, Comment.created_at, Comment.id, pagination, keyset)
+        
+        # Rows unpack positionally in the order selected above; the dicts go
+        # straight to orjson
+        return trusted_json_response([
+            {
+                "id": comment_id,
+                "content": content,
+                "created_at": created_at,
+                "blog": {"id": blog_id, "title": blog_title, "author": blog_author}
+            }
+            for comment_id, content, created_at, blog_id, blog_title, blog_author in rows
+        ], response)
         
     except Exception as e:
-        logger.error(f"User comments retrieval error: {str(e)}")
+        logger.error("User comments retrieval error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve your comments"
@@ -493,10 +722,10 @@ async def get_my_comments(
 
 
 @router.patch("/{user_id}/update", response_model=UserResponse)
-async def admin_update_user(
+def admin_update_user(
     user_id: int,
     user_data: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentIdentity = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -504,46 +733,41 @@ async def admin_update_user(
     
     Allows admin to update any user's information including active status
     """
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        # No uniqueness pre-check: the unique index on email rejects a taken
+        # address, which is_email_conflict recognizes below
+        user = update_user_returning(db, user_id, user_data.model_dump(exclude_unset=True))
+        db.commit()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        update_data = user_data.dict(exclude_unset=True)
+        AuthService.invalidate_login_cache(user.old_email)
+        AuthService.invalidate_identity(user.id)
+        cache.delete(profile_cache_key(user.id))
         
-        # Check email uniqueness if email is being updated
-        if "email" in update_data and update_data["email"] != user.email:
-            existing_user = db.query(User).filter(User.email == update_data["email"]).first()
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
+        logger.info("User updated by admin: %s by %s", user.email, current_user.email)
         
-        # Update user fields
-        for field, value in update_data.items():
-            setattr(user, field, value)
-        
-        db.commit()
-        db.refresh(user)
-        
-        logger.info(f"User updated by admin: {user.email} by {current_user.email}")
-        
-        return UserResponse.from_orm(user)
+        return UserResponse.from_orm_trusted(user)
         
+    except IntegrityError as e:
+        db.rollback()
+        if not is_email_conflict(e):
+            logger.error("Admin user update error: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to update user"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Admin user update error: {str(e)}")
+        logger.error("Admin user update error: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
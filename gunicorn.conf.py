@@ -0,0 +1,14 @@
+# gunicorn.conf.py
+# Production server: gunicorn -c gunicorn.conf.py app.main:app
+#
+# UvicornWorker picks up uvloop and httptools automatically (both come with
+# uvicorn[standard]). Keep workers * (db_pool_size + db_max_overflow) under
+# Postgres max_connections, or set use_pgbouncer and let PgBouncer pool.
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+keepalive = 5
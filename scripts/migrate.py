@@ -0,0 +1,18 @@
+# scripts/migrate.py
+"""
+Create database tables and run data backfills
+
+Production workers no longer do this on startup; run it once per deploy:
+
+    python -m scripts.migrate
+"""
+import logging
+
+from app import models  # noqa: F401  (registers tables on Base.metadata)
+from app.database import init_db
+
+logging.basicConfig(level=logging.INFO)
+
+
+if __name__ == "__main__":
+    init_db()